@@ -1,19 +1,22 @@
 #!/usr/bin/env python3
 # app.py - Simplified Flask application for crawler robot
 
+import functools
+import hashlib
 import os
 import sys
 import logging
 import signal
-import subprocess
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, render_template, Response, jsonify, request
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room, leave_room
 
 from camera_manager import CameraManager
 from config_manager import ConfigManager
 from hardware_manager import HardwareManager
-from utils import setup_logging
+from utils import JsonCodec, OrjsonProvider, prebuilt_json, setup_logging
 from wifi_manager import WifiManager, WifiError
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -24,8 +27,21 @@ app = Flask(
     static_folder=os.path.join(BASE_DIR, "web", "static"),
 )
 app.config["SECRET_KEY"] = "crawler_secret_key"
-
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet')
+app.json = OrjsonProvider(app)
+# index.html has no template logic, so it is read once and served as bytes;
+# set to False if the page ever needs Jinja rendering again.
+app.config["STATIC_INDEX"] = True
+
+# Telemetry batches compress well; compress any HTTP-transport payload over 256 bytes
+# (websocket frames use the permessage-deflate that eventlet negotiates itself).
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode='eventlet',
+    json=JsonCodec,
+    http_compression=True,
+    compression_threshold=256,
+)
 
 # Managers
 config_manager = None
@@ -34,6 +50,44 @@ hardware_manager = None
 wifi_manager = None
 logger = None
 telemetry_thread_started = False
+_index_cache = None  # (body, etag) for the static dashboard page
+
+# Multipart framing for /video_feed; built once and written as separate chunks
+# so the JPEG payload is never concatenated (copied) per frame. Only the
+# Content-Length value is formatted per part.
+_FRAME_PREFIX = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: "
+_FRAME_SUFFIX = b"\r\n"
+_CAMERA_START_ARGS = {
+    "front": {"want_front": True, "want_rear": False},
+    "rear": {"want_front": False, "want_rear": True},
+}
+
+# Open /video_feed streams per camera, each fed through its own queue by one shared
+# dispatcher task, so N viewers cost one blocking wait per frame instead of N.
+_frame_subscribers = {camera: set() for camera in _CAMERA_START_ARGS}
+_frame_dispatchers = {}
+
+TELEMETRY_SAMPLE_INTERVAL = 0.5
+TELEMETRY_FLUSH_INTERVAL = 1.0
+TELEMETRY_FANOUT_SLICE = 50
+TELEMETRY_MAX_BACKLOG = 3
+TELEMETRY_ROOM = "telemetry"
+SUBSCRIPTION_TOPICS = frozenset({TELEMETRY_ROOM})
+
+# Encoded once at import; see prebuilt_json for when that applies
+_ESTOP_MSG = prebuilt_json({"message": "Emergency stop activated"})
+
+# Last motor_ack sent to each client; repeated joystick samples are not re-acked.
+_last_motor_ack = {}
+
+# Telemetry state as last sent to the telemetry room; periodic emits only carry
+# the parts that changed relative to it.
+_last_telemetry = {}
+# Subscribers that were skipped for backlog and need a full resync.
+_telemetry_stale_sids = set()
+# Return-to-start results posted by the worker thread; telemetry_loop handles them
+# on the hub, the only place socketio.emit and _last_telemetry may be touched.
+_return_to_start_results = deque()
 
 def initialize_systems():
     """Initialize all subsystems"""
@@ -45,9 +99,15 @@ def initialize_systems():
     logger = setup_logging(config.get("system", {}).get("log_level", "INFO"))
     logger.info("Starting Crawler Robot Control System...")
     
-    hardware_manager = HardwareManager(config)
-    camera_manager = CameraManager(config)
-    wifi_manager = WifiManager(logger)
+    # I2C setup and camera probing are independent and I/O bound; overlap them so
+    # start-up costs the slowest subsystem rather than the sum of all three.
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="init") as executor:
+        hardware_future = executor.submit(HardwareManager, config)
+        camera_future = executor.submit(CameraManager, config)
+        wifi_future = executor.submit(WifiManager, logger)
+        hardware_manager = hardware_future.result()
+        camera_manager = camera_future.result()
+        wifi_manager = wifi_future.result()
 
     logger.info("All systems initialized")
     start_background_tasks()
@@ -62,42 +122,227 @@ def start_background_tasks():
     telemetry_thread_started = True
 
     def telemetry_loop():
+        samples = deque(maxlen=20)
         socketio.sleep(1)
+        next_tick = time.monotonic()
+        next_flush = next_tick + TELEMETRY_FLUSH_INTERVAL
         while True:
             try:
+                while _return_to_start_results:
+                    socketio.emit(
+                        "return_to_start_complete", _return_to_start_results.popleft(), to=TELEMETRY_ROOM
+                    )
+                    # The snapshot is the new baseline; older buffered samples would undo it
+                    samples.clear()
+                    _emit_telemetry_snapshot()
                 if hardware_manager:
-                    telemetry = hardware_manager.get_telemetry()
+                    # I2C reads block in the kernel; keep them off the eventlet hub
+                    telemetry = _run_blocking(hardware_manager.get_telemetry)
                     if telemetry:
-                        socketio.emit("telemetry", telemetry)
+                        samples.append(telemetry)
+                if samples and time.monotonic() >= next_flush:
+                    batch = [_telemetry_delta(sample) for sample in _compact_telemetry_batch(samples)]
+                    samples.clear()
+                    batch = [delta for delta in batch if delta]
+                    if batch:
+                        _broadcast_telemetry(batch)
+                    next_flush = time.monotonic() + TELEMETRY_FLUSH_INTERVAL
             except Exception:
                 if logger:
                     logger.exception("Telemetry loop failed")
-            socketio.sleep(0.5)
+
+            # Fixed-rate schedule: sleep only the remainder of the tick, and
+            # drop missed ticks rather than bursting to catch up.
+            next_tick += TELEMETRY_SAMPLE_INTERVAL
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                socketio.sleep(delay)
+            else:
+                next_tick = time.monotonic()
 
     socketio.start_background_task(telemetry_loop)
 
 
+def _compact_telemetry_batch(samples):
+    """Return the buffered samples; only the newest keeps the (cumulative) odometry path."""
+    batch = []
+    last_index = len(samples) - 1
+    for index, sample in enumerate(samples):
+        odometry = sample.get("odometry")
+        if index != last_index and odometry and "path" in odometry:
+            sample = dict(sample, odometry={k: v for k, v in odometry.items() if k != "path"})
+        batch.append(sample)
+    return batch
+
+
+def _telemetry_delta(sample):
+    """Return the parts of a sample that differ from _last_telemetry and fold them into it.
+
+    Dict values are compared one level deep. A top-level key the sample no longer has
+    (e.g. battery after a failed read) is sent as None so clients drop the stale value.
+    """
+    delta = {}
+    for key in [key for key in _last_telemetry if key not in sample]:
+        del _last_telemetry[key]
+        delta[key] = None
+    for key, value in sample.items():
+        previous = _last_telemetry.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            changed = {k: v for k, v in value.items() if previous.get(k) != v}
+            if changed:
+                delta[key] = changed
+                previous.update(changed)
+        elif previous != value:
+            delta[key] = value
+            _last_telemetry[key] = dict(value) if isinstance(value, dict) else value
+    return delta
+
+
+def _emit_telemetry_snapshot():
+    """Send a full telemetry snapshot to subscribers and make it the new delta baseline."""
+    telemetry = hardware_manager.get_telemetry_snapshot()
+    _telemetry_delta(telemetry)
+    socketio.emit("telemetry", telemetry, to=TELEMETRY_ROOM)
+
+
+def _client_backlog(eio_sid):
+    """Number of packets still queued for a client's Engine.IO socket (0 if unknown)."""
+    eio_socket = socketio.server.eio.sockets.get(eio_sid)
+    try:
+        return eio_socket.queue.qsize()
+    except AttributeError:
+        return 0
+
+
+def _broadcast_telemetry(batch, namespace="/"):
+    """Send a delta batch to the telemetry room with a single (once-encoded) room emit.
+
+    Clients that have not drained their previous packets are skipped this round and
+    receive the full baseline once they catch up, since the deltas they missed are gone.
+    """
+    participants = list(socketio.server.manager.get_participants(namespace, TELEMETRY_ROOM))
+    skip_sids = []
+    recovered = []
+    for start in range(0, len(participants), TELEMETRY_FANOUT_SLICE):
+        for sid, eio_sid in participants[start:start + TELEMETRY_FANOUT_SLICE]:
+            if _client_backlog(eio_sid) > TELEMETRY_MAX_BACKLOG:
+                _telemetry_stale_sids.add(sid)
+                skip_sids.append(sid)
+            elif sid in _telemetry_stale_sids:
+                _telemetry_stale_sids.discard(sid)
+                recovered.append(sid)
+                skip_sids.append(sid)
+        socketio.sleep(0)
+
+    socketio.emit("telemetry_batch", batch, to=TELEMETRY_ROOM, skip_sid=skip_sids, namespace=namespace)
+
+    # Only clients that just caught up get an individual (full) resync
+    if recovered:
+        snapshot = dict(_last_telemetry)
+        for sid in recovered:
+            socketio.emit("telemetry", snapshot, to=sid, namespace=namespace)
+
+
+_WIFI_PASSTHROUGH_FIELDS = ("psk", "username", "password", "bssid")
+_WIFI_LOWER_FIELDS = ("eap_method", "phase2_auth")
+_WIFI_STR_FIELDS = ("anonymous_identity", "domain_suffix_match", "ca_cert_pem")
+_DEVNULL_STDIO = [
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+]
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off"})
+
+
+def _norm_str(value, lower=False):
+    """Strip (and optionally lower-case) a string field; blanks and non-strings become None."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if lower:
+        value = value.lower()
+    return value or None
+
+
+def _coerce_bool(value):
+    """Interpret JSON/form booleans ("off", 0, false...); anything unrecognised becomes None."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() not in _FALSE_STRINGS
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return None
+
+
 def _return_to_start_complete(result):
     payload = {
         "success": bool(result.get("success")) if isinstance(result, dict) else False,
         "reason": result.get("reason") if isinstance(result, dict) else None,
     }
-    socketio.emit("return_to_start_complete", payload)
-    if hardware_manager:
-        socketio.emit("telemetry", hardware_manager.get_telemetry())
+    # Runs on the worker thread; telemetry_loop emits it from the hub
+    _return_to_start_results.append(payload)
+
+
+def ttl_cached_json(ttl):
+    """Cache a view's JSON body for ttl seconds and serve it with an ETag (304 on If-None-Match).
+
+    The wrapped view gets an invalidate() attribute for callers that change its data.
+    """
+    def decorator(view):
+        cache = [0.0, None, None]  # expiry, body, etag
+
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            if cache[1] is None or now >= cache[0]:
+                body = JsonCodec.dumps_bytes(view(*args, **kwargs))
+                cache[:] = [now + ttl, body, hashlib.sha1(body).hexdigest()]
+            response = Response(cache[1], mimetype="application/json")
+            response.set_etag(cache[2])
+            return response.make_conditional(request)
+
+        def invalidate():
+            cache[1] = None
+
+        wrapper.invalidate = invalidate
+        return wrapper
+    return decorator
+
+
+def _run_blocking(func, *args, **kwargs):
+    """Run a blocking call (nmcli, camera start/stop) without stalling the eventlet hub."""
+    if socketio.async_mode == "eventlet":
+        from eventlet import tpool
+        return tpool.execute(func, *args, **kwargs)
+    return func(*args, **kwargs)
 
 # Routes
 @app.route("/")
 def index():
-    return render_template("index.html")
+    if not app.config["STATIC_INDEX"]:
+        return render_template("index.html")
+
+    global _index_cache
+    if _index_cache is None:
+        with open(os.path.join(app.template_folder, "index.html"), "rb") as f:
+            body = f.read()
+        _index_cache = (body, hashlib.sha1(body).hexdigest())
+
+    body, etag = _index_cache
+    response = Response(body, mimetype="text/html")
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return response.make_conditional(request)
 
 @app.route("/api/status")
+@ttl_cached_json(0.25)
 def api_status():
-    return jsonify({
+    return {
         "success": True,
         "hardware": hardware_manager.get_status() if hardware_manager else {},
         "cameras": camera_manager.get_status() if camera_manager else {},
-    })
+    }
 
 
 @app.route("/api/camera/quality", methods=["POST"])
@@ -107,7 +352,9 @@ def api_camera_quality():
 
     data = request.get_json(force=True, silent=True) or {}
     profile = data.get("profile", "balanced")
-    applied = camera_manager.apply_quality_profile(profile)
+    applied = _run_blocking(camera_manager.apply_quality_profile, profile)
+    # Otherwise a poll within the TTL would report (and re-select) the old profile
+    api_status.invalidate()
     status_code = 200 if applied else 400
     return jsonify({"success": applied, "profile": profile}), status_code
 
@@ -118,7 +365,7 @@ def api_wifi_networks():
         return jsonify({"success": False, "error": "Wi-Fi manager unavailable"}), 503
 
     try:
-        result = wifi_manager.scan_networks()
+        result = _run_blocking(wifi_manager.scan_networks)
     except WifiError as exc:
         return jsonify({"success": False, "error": str(exc)}), 500
 
@@ -135,58 +382,18 @@ def api_wifi_connect():
     if not ssid:
         return jsonify({"success": False, "error": "SSID is required"}), 400
 
-    psk = data.get("psk")
-    username = data.get("username")
-    password = data.get("password")
-    bssid = data.get("bssid")
-    eap_method = data.get("eap_method")
-    phase2_auth = data.get("phase2_auth")
-    anonymous_identity = data.get("anonymous_identity")
-    domain_suffix_match = data.get("domain_suffix_match")
-    system_ca_certs = data.get("system_ca_certs")
-    ca_cert_pem = data.get("ca_cert_pem")
-
-    if isinstance(system_ca_certs, str):
-        system_ca_certs = system_ca_certs.lower() not in {"false", "0", "no", "off"}
-
-    if isinstance(system_ca_certs, (int, float)):
-        system_ca_certs = bool(system_ca_certs)
-
-    if isinstance(system_ca_certs, bool) is False and system_ca_certs is not None:
-        system_ca_certs = None
-
-    if isinstance(eap_method, str):
-        eap_method = eap_method.strip().lower() or None
-
-    if isinstance(phase2_auth, str):
-        phase2_auth = phase2_auth.strip().lower() or None
-
-    if isinstance(anonymous_identity, str):
-        anonymous_identity = anonymous_identity.strip() or None
-
-    if isinstance(domain_suffix_match, str):
-        domain_suffix_match = domain_suffix_match.strip() or None
-
-    if isinstance(ca_cert_pem, str):
-        ca_cert_pem = ca_cert_pem.strip() or None
-
-    connect_kwargs = {
-        "psk": psk,
-        "username": username,
-        "password": password,
-        "bssid": bssid,
-        "eap_method": eap_method,
-        "phase2_auth": phase2_auth,
-        "anonymous_identity": anonymous_identity,
-        "domain_suffix_match": domain_suffix_match,
-        "ca_cert_pem": ca_cert_pem,
-    }
+    connect_kwargs = {key: data.get(key) for key in _WIFI_PASSTHROUGH_FIELDS}
+    for key in _WIFI_LOWER_FIELDS:
+        connect_kwargs[key] = _norm_str(data.get(key), lower=True)
+    for key in _WIFI_STR_FIELDS:
+        connect_kwargs[key] = _norm_str(data.get(key))
 
+    system_ca_certs = _coerce_bool(data.get("system_ca_certs"))
     if system_ca_certs is not None:
         connect_kwargs["system_ca_certs"] = system_ca_certs
 
     try:
-        result = wifi_manager.connect(ssid, **connect_kwargs)
+        result = _run_blocking(wifi_manager.connect, ssid, **connect_kwargs)
     except WifiError as exc:
         return jsonify({"success": False, "error": str(exc)}), 400
 
@@ -199,7 +406,7 @@ def api_wifi_hotspot_status():
         return jsonify({"success": False, "error": "Wi-Fi manager unavailable"}), 503
 
     try:
-        status = wifi_manager.get_hotspot_status()
+        status = _run_blocking(wifi_manager.get_hotspot_status)
     except WifiError as exc:
         return jsonify({"success": False, "error": str(exc)}), 500
 
@@ -218,7 +425,8 @@ def api_wifi_hotspot_start():
     channel = data.get("channel")
 
     try:
-        result = wifi_manager.start_hotspot(
+        result = _run_blocking(
+            wifi_manager.start_hotspot,
             ssid=ssid,
             password=password,
             band=band,
@@ -236,7 +444,7 @@ def api_wifi_hotspot_stop():
         return jsonify({"success": False, "error": "Wi-Fi manager unavailable"}), 503
 
     try:
-        result = wifi_manager.stop_hotspot()
+        result = _run_blocking(wifi_manager.stop_hotspot)
     except WifiError as exc:
         return jsonify({"success": False, "error": str(exc)}), 400
 
@@ -250,7 +458,13 @@ def api_shutdown():
 
     logger.warning("Shutdown requested via API")
     try:
-        subprocess.Popen(["sudo", "shutdown", "-h", "now"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # posix_spawn skips Popen's pipe setup and fd-closing loop; output is discarded anyway.
+        os.posix_spawnp(
+            "sudo",
+            ["sudo", "shutdown", "-h", "now"],
+            os.environ,
+            file_actions=_DEVNULL_STDIO,
+        )
     except Exception as exc:
         logger.exception("Failed to invoke shutdown")
         return jsonify({"success": False, "error": str(exc)}), 500
@@ -261,39 +475,104 @@ def api_shutdown():
 @app.route("/video_feed/<camera>")
 def video_feed(camera):
     """Stream video from specified camera (front or rear). Auto-start threads on demand."""
-    if camera == "front":
-        camera_manager.start_cameras(want_front=True, want_rear=False)
-    elif camera == "rear":
-        camera_manager.start_cameras(want_front=False, want_rear=True)
+    start_args = _CAMERA_START_ARGS.get(camera)
+    if start_args is None:
+        return jsonify({"success": False, "error": f"Unknown camera '{camera}'"}), 404
+    if not camera_manager:
+        return jsonify({"success": False, "error": "Camera manager unavailable"}), 503
+
+    _run_blocking(camera_manager.start_cameras, **start_args)
 
     def generate():
-        while True:
-            frame = None
-            if camera == "front":
-                frame = camera_manager.get_latest_frame("front")
-            elif camera == "rear":
-                frame = camera_manager.get_latest_frame("rear")
-
-            if frame:
-                yield (b"--frame\r\n"
-                       b"Content-Type: image/jpeg\r\n\r\n" + frame + b"\r\n")
-            else:
-                time.sleep(0.05)
+        eio = socketio.server.eio
+        frames = eio.create_queue()
+        empty = eio.get_queue_empty_exception()
+        # Show the current frame straight away; the dispatcher delivers the newer ones
+        frame, seq = camera_manager.get_latest_frame_with_seq(camera)
+        _frame_subscribers[camera].add(frames)
+        _ensure_frame_dispatcher(camera, seq)
+        try:
+            while True:
+                if frame:
+                    yield b"%s%d\r\n\r\n" % (_FRAME_PREFIX, len(frame))
+                    yield frame
+                    yield _FRAME_SUFFIX
+                try:
+                    frame = frames.get(timeout=1.0)
+                except empty:
+                    frame = None
+                    # Restart the dispatcher if it died while this stream was open
+                    _ensure_frame_dispatcher(camera, seq)
+        finally:
+            _frame_subscribers[camera].discard(frames)
 
     return Response(generate(),
-                    mimetype="multipart/x-mixed-replace; boundary=frame")
+                    mimetype="multipart/x-mixed-replace; boundary=frame",
+                    direct_passthrough=True)
+
+def _ensure_frame_dispatcher(camera, last_seq):
+    """Start the dispatcher task for camera unless one is already running."""
+    if camera not in _frame_dispatchers:
+        _frame_dispatchers[camera] = socketio.start_background_task(_dispatch_frames, camera, last_seq)
+
+
+def _dispatch_frames(camera, last_seq):
+    """Wait for each frame newer than last_seq once and hand it to every open stream of this camera."""
+    subscribers = _frame_subscribers[camera]
+    empty = socketio.server.eio.get_queue_empty_exception()
+    try:
+        while subscribers:
+            # Block (in the thread pool) until the capture thread publishes a newer
+            # frame, so each JPEG is sent exactly once at the camera's own rate.
+            timeout = min(1.0, max(0.05, 2 * camera_manager.frame_interval(camera)))
+            frame, seq = _run_blocking(camera_manager.wait_for_frame, camera, last_seq, timeout)
+            if not frame or seq == last_seq:
+                continue
+            last_seq = seq
+            for frames in list(subscribers):
+                # Keep only the newest frame for a client that hasn't taken the last one
+                try:
+                    while not frames.empty():
+                        frames.get_nowait()
+                except empty:
+                    pass
+                frames.put_nowait(frame)
+    except Exception:
+        if logger:
+            logger.exception("Frame dispatcher for %s camera failed", camera)
+    finally:
+        # Always deregister so the next /video_feed request starts a fresh dispatcher
+        _frame_dispatchers.pop(camera, None)
 
 # WebSocket handlers
 @socketio.on("connect")
 def ws_connect():
     logger.info(f"Client connected: {request.sid}")
     emit("connected", {"message": "Connected to crawler"})
-    if hardware_manager:
-        emit("telemetry", hardware_manager.get_telemetry())
 
 @socketio.on("disconnect")
 def ws_disconnect():
     logger.info(f"Client disconnected: {request.sid}")
+    _last_motor_ack.pop(request.sid, None)
+    _telemetry_stale_sids.discard(request.sid)
+
+@socketio.on("subscribe")
+def ws_subscribe(data):
+    topics = data.get("topics", []) if isinstance(data, dict) else []
+    joined = [topic for topic in topics if topic in SUBSCRIPTION_TOPICS]
+    for topic in joined:
+        join_room(topic)
+    if TELEMETRY_ROOM in joined and hardware_manager:
+        # Start the client from the same baseline the deltas are computed against
+        emit("telemetry", dict(_last_telemetry) or hardware_manager.get_telemetry_snapshot())
+    emit("subscribed", {"topics": joined})
+
+@socketio.on("unsubscribe")
+def ws_unsubscribe(data):
+    topics = data.get("topics", []) if isinstance(data, dict) else []
+    for topic in topics:
+        if topic in SUBSCRIPTION_TOPICS:
+            leave_room(topic)
 
 @socketio.on("motor_control")
 def ws_motor_control(data):
@@ -301,13 +580,15 @@ def ws_motor_control(data):
     right = int(data.get("right", 0))
     if hardware_manager:
         hardware_manager.set_motor_speed(left, right)
-    emit("motor_ack", {"left": left, "right": right})
+    if _last_motor_ack.get(request.sid) != (left, right):
+        _last_motor_ack[request.sid] = (left, right)
+        emit("motor_ack", {"left": left, "right": right})
 
 @socketio.on("emergency_stop")
 def ws_emergency_stop():
     if hardware_manager:
         hardware_manager.emergency_stop()
-    emit("stopped", {"message": "Emergency stop activated"})
+    emit("stopped", _ESTOP_MSG)
 
 
 @socketio.on("reset_odometry")
@@ -321,7 +602,7 @@ def ws_reset_odometry():
         "odometry_reset",
         {"success": True, "sequence": hardware_manager.odometry_sequence},
     )
-    socketio.emit("telemetry", hardware_manager.get_telemetry())
+    _emit_telemetry_snapshot()
 
 
 @socketio.on("return_to_start")
@@ -342,7 +623,7 @@ def ws_return_to_start():
         {"success": success, "message": message, "in_progress": success},
     )
 
-    socketio.emit("telemetry", hardware_manager.get_telemetry())
+    _emit_telemetry_snapshot()
 
 def cleanup():
     """Cleanup on shutdown"""
@@ -1,14 +1,28 @@
 # backend/camera_manager.py
+import fcntl
+import functools
 import logging
+import os
+import struct
 import threading
 import time
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
 
 import cv2
 import numpy as np
 
+try:
+    from turbojpeg import TJFLAG_BOTTOMUP, TJPF_BGR, TJSAMP_420, TurboJPEG
+except ImportError:  # optional: falls back to cv2.imencode
+    TurboJPEG = None
+
 logger = logging.getLogger("camera_manager")
 
+# Encoded JPEG as published to streamers. Always bytes: /video_feed yields frames
+# straight to the WSGI server, and PEP 3333 only allows bytes there.
+Frame = bytes
+
 
 QUALITY_PROFILES = {
     "low": {
@@ -26,13 +40,270 @@ QUALITY_PROFILES = {
 }
 
 
+def _profile_key(front: dict, rear: dict) -> tuple:
+    """Canonical, hashable form of a front/rear camera settings pair."""
+    return tuple(
+        (tuple(int(v) for v in cam.get("resolution", ())), int(cam.get("fps", 0)), int(cam.get("quality", 0)))
+        for cam in (front, rear)
+    )
+
+
+# Settings -> profile name, so recognising the active profile is one dict lookup.
+_PROFILE_INDEX = {
+    _profile_key(p.get("front", {}), p.get("rear", {})): name for name, p in QUALITY_PROFILES.items()
+}
+
+# Smoothing factor for the measured inter-frame interval.
+FRAME_INTERVAL_ALPHA = 0.1
+
+# Cores the encoder threads are pinned to (Pi 4/5 have four). Each camera's encodes
+# stay on one core and keep its working set warm in that core's cache; the two
+# encoders never share a core. Nothing else in the process is pinned.
+ENCODER_CPUS = {"front": 2, "rear": 3}
+
+
+def _load_turbojpeg():
+    """Create the shared libjpeg-turbo encoder, or None when PyTurboJPEG/libturbojpeg is missing."""
+    if TurboJPEG is None:
+        logger.info("PyTurboJPEG not installed; using cv2.imencode for JPEG encoding.")
+        return None
+    try:
+        return TurboJPEG()
+    except Exception as exc:
+        logger.warning("libturbojpeg could not be loaded (%s); using cv2.imencode.", exc)
+        return None
+
+
+# One encoder for every camera thread; PyTurboJPEG allocates a compressor per call,
+# so sharing the instance is thread-safe.
+_turbojpeg = _load_turbojpeg()
+
+
+def _encode_jpeg(frame_bgr: np.ndarray, quality: int, bottom_up: bool = False) -> Optional[Frame]:
+    """
+    JPEG-encode a BGR frame with libjpeg-turbo's SIMD path, falling back to OpenCV.
+    bottom_up encodes the rows in reverse order (a vertical flip); only supported by TurboJPEG.
+    """
+    if _turbojpeg is not None:
+        return _turbojpeg.encode(
+            frame_bgr,
+            quality=quality,
+            pixel_format=TJPF_BGR,
+            jpeg_subsample=TJSAMP_420,
+            flags=TJFLAG_BOTTOMUP if bottom_up else 0,
+        )
+    ok, buf = cv2.imencode(".jpg", frame_bgr, _imencode_params(quality))
+    return buf.tobytes() if ok else None
+
+
+@functools.lru_cache(maxsize=8)
+def _imencode_params(quality: int) -> Tuple[int, ...]:
+    """
+    cv2.imencode parameters for live streaming: single-pass baseline JPEG (no Huffman
+    optimisation or progressive scans, which some builds enable) with 4:2:0 chroma.
+    """
+    params = [
+        int(cv2.IMWRITE_JPEG_QUALITY), int(quality),
+        int(cv2.IMWRITE_JPEG_OPTIMIZE), 0,
+        int(cv2.IMWRITE_JPEG_PROGRESSIVE), 0,
+    ]
+    sampling = getattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR", None)  # OpenCV >= 4.5.5
+    if sampling is not None:
+        params += [int(sampling), int(cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420)]
+    return tuple(params)
+
+
+def _picamera2_quality(quality: int):
+    """Map a 0-100 JPEG quality onto Picamera2's encoder Quality presets."""
+    from picamera2.encoders import Quality
+
+    if quality < 55:
+        return Quality.VERY_LOW
+    if quality < 70:
+        return Quality.LOW
+    if quality < 80:
+        return Quality.MEDIUM
+    if quality < 90:
+        return Quality.HIGH
+    return Quality.VERY_HIGH
+
+
+def _sleep_until(deadline: float, period: float) -> float:
+    """
+    Sleep until a monotonic deadline and return it as the base for the next one.
+    Running more than a period behind resyncs to now instead of bursting to catch up.
+    """
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    elif delay < -period:
+        return time.monotonic()
+    return deadline
+
+
+def _encode_jpeg_yuv420(yuv: np.ndarray, size: Tuple[int, int], quality: int) -> Frame:
+    """JPEG-encode a planar I420 frame (Y plane then U and V) with no colour conversion."""
+    width, height = size
+    return _turbojpeg.encode_from_yuv(yuv, height, width, quality=quality, jpeg_subsample=TJSAMP_420)
+
+
+@functools.lru_cache(maxsize=16)
 def _make_blank_jpeg(text: str, size: Tuple[int, int] = (640, 480)) -> bytes:
-    """Return a simple black JPEG with centered text; used as a placeholder when no frame is available."""
+    """
+    Return a simple black JPEG with centered text; used as a placeholder when no frame is available.
+    Cached per (text, size): the output is deterministic and the bytes are immutable.
+    """
     w, h = size
     frame = np.zeros((h, w, 3), dtype=np.uint8)
     cv2.putText(frame, text, (20, h // 2), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (200, 200, 200), 2, cv2.LINE_AA)
-    ok, buf = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 75])
-    return buf.tobytes() if ok else b""
+    jpeg = _encode_jpeg(frame, 75)
+    return jpeg if jpeg is not None else b""
+
+
+class _FrameEncoder:
+    """
+    Encodes raw frames on its own thread so JPEG work never holds up capture.
+    The capture loop drops each frame into a single slot (overwriting any frame not
+    yet picked up); the encoder always takes the newest, so a slow encode costs
+    dropped raw frames rather than capture stalls. A frame may come with a release
+    callback (e.g. a Picamera2 request), called once the frame is encoded or dropped.
+    Encoded/dropped counts are logged periodically so fps/quality can be tuned from data.
+    """
+
+    STATS_INTERVAL = 30.0  # seconds between debug-level throughput reports
+
+    def __init__(
+        self,
+        name: str,
+        encode: Callable[[Any], Optional[Frame]],
+        publish: Callable[[Frame], None],
+        cpu: Optional[int] = None,
+    ):
+        self._encode = encode
+        self._publish = publish
+        self._cpu = cpu
+        self._lock = threading.Lock()  # guards the slot swap only
+        self._slot: Optional[Tuple[Any, Optional[Callable[[], None]]]] = None
+        self.encoded = 0
+        self.dropped = 0  # frames overwritten in the slot before the encoder took them
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def submit(self, frame: Any, release: Optional[Callable[[], None]] = None) -> None:
+        with self._lock:
+            dropped, self._slot = self._slot, (frame, release)
+            if dropped is not None:
+                self.dropped += 1
+        self._release(dropped)
+        self._ready.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._ready.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        with self._lock:
+            pending, self._slot = self._slot, None
+        self._release(pending)
+        logger.info("%s stopped: %d frames encoded, %d dropped", self._thread.name, self.encoded, self.dropped)
+
+    @staticmethod
+    def _release(item: Optional[Tuple[Any, Optional[Callable[[], None]]]]) -> None:
+        if item is not None and item[1] is not None:
+            try:
+                item[1]()
+            except Exception:
+                logger.debug("Releasing a dropped frame failed", exc_info=True)
+
+    def _run(self) -> None:
+        if self._cpu is not None and self._cpu < (os.cpu_count() or 1):
+            try:
+                # pid 0 is the calling thread on Linux, so only this encoder is pinned
+                os.sched_setaffinity(0, {self._cpu})
+            except (AttributeError, OSError) as exc:
+                logger.debug("Could not pin %s to CPU %d: %s", self._thread.name, self._cpu, exc)
+        next_report = time.monotonic() + self.STATS_INTERVAL
+        while True:
+            self._ready.wait()
+            self._ready.clear()
+            if self._stop.is_set():
+                return
+            with self._lock:
+                item, self._slot = self._slot, None
+            if item is None:
+                continue
+            try:
+                jpeg = self._encode(item[0])
+            except Exception:
+                logger.exception("%s failed to encode a frame", self._thread.name)
+                continue
+            finally:
+                self._release(item)
+            if jpeg is not None:
+                self._publish(jpeg)
+                self.encoded += 1
+            now = time.monotonic()
+            if now >= next_report:
+                next_report = now + self.STATS_INTERVAL
+                logger.debug("%s: %d frames encoded, %d dropped", self._thread.name, self.encoded, self.dropped)
+
+
+# struct v4l2_capability (104 bytes) and VIDIOC_QUERYCAP = _IOR('V', 0, struct v4l2_capability)
+_V4L2_CAPABILITY = struct.Struct("16s32s32sIII12x")
+_VIDIOC_QUERYCAP = 0x80685600
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+
+def _usb_capture_indices() -> Optional[List[int]]:
+    """
+    /dev/videoN indices of USB video-capture nodes, from sysfs plus VIDIOC_QUERYCAP.
+    Unlike opening each node with OpenCV this negotiates no buffers and reads no frames,
+    and it skips the Pi's CSI/ISP/codec nodes and UVC metadata nodes.
+    Returns None when V4L2 cannot be queried this way (non-Linux).
+    """
+    try:
+        names = os.listdir("/sys/class/video4linux")
+    except OSError:
+        return None
+
+    found = []
+    for name in names:
+        if not name.startswith("video") or not name[5:].isdigit():
+            continue
+        try:
+            fd = os.open("/dev/" + name, os.O_RDWR | os.O_NONBLOCK)
+        except OSError:
+            continue
+        try:
+            buf = bytearray(_V4L2_CAPABILITY.size)
+            fcntl.ioctl(fd, _VIDIOC_QUERYCAP, buf)
+        except OSError:
+            continue
+        finally:
+            os.close(fd)
+        _driver, _card, bus_info, _version, caps, device_caps = _V4L2_CAPABILITY.unpack(buf)
+        if caps & _V4L2_CAP_DEVICE_CAPS:
+            caps = device_caps
+        if caps & _V4L2_CAP_VIDEO_CAPTURE and bus_info.startswith(b"usb-"):
+            found.append(int(name[5:]))
+    return sorted(found)
+
+
+def _publish_output(publish: Callable[[Frame], None]):
+    """Picamera2 encoder output that publishes each finished JPEG as the latest frame."""
+    from picamera2.outputs import Output
+
+    class _PublishOutput(Output):
+        def outputframe(self, frame, keyframe=True, timestamp=None, packet=None, audio=False):
+            if frame:
+                publish(frame)
+
+    return _PublishOutput()
 
 
 class CameraManager:
@@ -78,11 +349,20 @@ class CameraManager:
         self.front_res = tuple(f_cfg.get("resolution", (1280, 720)))
         self.front_fps = int(f_cfg.get("fps", 30))
         self.front_quality = int(f_cfg.get("quality", 85))
+        # Use the VideoCore MJPEG block when the platform has one (Pi 4 and earlier)
+        self.front_hw_encoder = bool(f_cfg.get("hardware_encoder", True))
 
         # Rear (USB) desired settings
         self.rear_res = tuple(r_cfg.get("resolution", (640, 480)))
         self.rear_fps = int(r_cfg.get("fps", 15))
         self.rear_quality = int(r_cfg.get("quality", 75))
+        # Rear camera is mounted upside down; set "vflip": false if yours is not, or
+        # "client" to have the browser flip it so native MJPEG can be passed through.
+        vflip = r_cfg.get("vflip", True)
+        self.rear_client_vflip = vflip == "client"
+        self.rear_vflip = bool(vflip) and not self.rear_client_vflip
+        # Only used when the rear camera is a Picamera2 sensor
+        self.rear_hw_encoder = bool(r_cfg.get("hardware_encoder", True))
         self.current_profile = self._detect_profile()
 
         # --- Runtime state ---------------------------------------------------
@@ -92,8 +372,10 @@ class CameraManager:
         self.front_backend: Optional[str] = None  # "picamera2" (default) or "gstreamer"
         self._front_thread: Optional[threading.Thread] = None
         self._front_stop = threading.Event()
-        self._front_lock = threading.Lock()
-        self._front_last_jpeg: Optional[bytes] = None
+        self._front_frame_ready = threading.Condition(threading.Lock())
+        self._front_latest: Tuple[Optional[Frame], int] = (None, 0)  # (jpeg, seq)
+        self._front_published_at: Optional[float] = None
+        self._front_frame_interval = 1.0 / max(1, self.front_fps)
         self._front_cap: Optional[cv2.VideoCapture] = None
         self._picam2 = None
 
@@ -103,36 +385,36 @@ class CameraManager:
         self.rear_backend: Optional[str] = None  # mirrors front backend behaviour
         self._rear_thread: Optional[threading.Thread] = None
         self._rear_stop = threading.Event()
-        self._rear_lock = threading.Lock()
-        self._rear_last_jpeg: Optional[bytes] = None
+        self._rear_frame_ready = threading.Condition(threading.Lock())
+        self._rear_latest: Tuple[Optional[Frame], int] = (None, 0)  # (jpeg, seq)
+        self._rear_published_at: Optional[float] = None
+        self._rear_frame_interval = 1.0 / max(1, self.rear_fps)
         self._rear_cap: Optional[cv2.VideoCapture] = None
         self._rear_index: Optional[int] = None
         self._rear_picam2 = None
 
-        # Probes
-        self.front_supported = self._probe_front_camera()
-        self.rear_supported = self._probe_rear_camera()
+        # Probes are independent device opens (Picamera2 serialises its own shared
+        # state), so run them side by side and pay for the slower one only.
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="camera-probe") as executor:
+            front_probe = executor.submit(self._probe_front_camera)
+            rear_probe = executor.submit(self._probe_rear_camera)
+            self.front_supported = front_probe.result()
+            self.rear_supported = rear_probe.result()
 
         # Placeholders so the UI shows *something* even before frames arrive
-        if not self._front_last_jpeg:
-            self._front_last_jpeg = _make_blank_jpeg("Front camera not started", self.front_res)
-        if not self._rear_last_jpeg:
-            self._rear_last_jpeg = _make_blank_jpeg("Rear camera not started", self.rear_res)
+        if self._front_latest[0] is None:
+            self._front_latest = (_make_blank_jpeg("Front camera not started", self.front_res), 0)
+        if self._rear_latest[0] is None:
+            self._rear_latest = (_make_blank_jpeg("Rear camera not started", self.rear_res), 0)
 
     # ---------------------- Quality profiles ---------------------------------
 
     def _detect_profile(self) -> str:
-        for name, profile in QUALITY_PROFILES.items():
-            front = profile.get("front", {})
-            rear = profile.get("rear", {})
-            if (tuple(front.get("resolution", ())) == tuple(self.front_res)
-                    and int(front.get("fps", 0)) == int(self.front_fps)
-                    and int(front.get("quality", 0)) == int(self.front_quality)
-                    and tuple(rear.get("resolution", ())) == tuple(self.rear_res)
-                    and int(rear.get("fps", 0)) == int(self.rear_fps)
-                    and int(rear.get("quality", 0)) == int(self.rear_quality)):
-                return name
-        return "custom"
+        key = _profile_key(
+            {"resolution": self.front_res, "fps": self.front_fps, "quality": self.front_quality},
+            {"resolution": self.rear_res, "fps": self.rear_fps, "quality": self.rear_quality},
+        )
+        return _PROFILE_INDEX.get(key, "custom")
 
     def apply_quality_profile(self, profile_name: str) -> bool:
         profile_key = (profile_name or "").lower()
@@ -213,6 +495,7 @@ class CameraManager:
                 "resolution": list(self.rear_res),
                 "fps": self.rear_fps,
                 "quality": self.rear_quality,
+                "client_vflip": self.rear_client_vflip,
             },
             "profile": self.current_profile,
         }
@@ -255,43 +538,100 @@ class CameraManager:
     def shutdown(self):
         """Alias for stop + cleanup resources."""
         self.stop_cameras()
+        self._close_picamera2()
 
     def cleanup(self):
         """Public cleanup hook used by the app on shutdown."""
         self.stop_cameras()
+        self._close_picamera2()
         # Drop references so large frame buffers can be GC'd promptly
-        with self._front_lock:
-            self._front_last_jpeg = None
-        with self._rear_lock:
-            self._rear_last_jpeg = None
+        self._front_latest = (None, self._front_latest[1])
+        self._rear_latest = (None, self._rear_latest[1])
+
+    def _close_picamera2(self):
+        """Close the Picamera2 instances, which otherwise stay open across stream restarts."""
+        for attr in ("_picam2", "_rear_picam2"):
+            cam = getattr(self, attr)
+            setattr(self, attr, None)
+            if cam is not None:
+                try:
+                    cam.close()
+                except Exception:
+                    pass
 
-    def get_latest_frame(self, which: str) -> Optional[bytes]:
+    # Frames are published as one (jpeg, seq) tuple replaced by a single attribute
+    # store, so readers always see a matching pair without taking any lock. The
+    # condition is only used to wake streams blocked in wait_for_frame().
+
+    def get_latest_frame(self, which: str) -> Optional[Frame]:
         """Return the latest JPEG frame for 'front' or 'rear'."""
         if which == "front":
-            with self._front_lock:
-                return self._front_last_jpeg
+            return self._front_latest[0]
         elif which == "rear":
-            with self._rear_lock:
-                return self._rear_last_jpeg
+            return self._rear_latest[0]
         return None
 
-    def mjpeg_generator(self, which: str, boundary: str = "frame"):
+    def get_latest_frame_with_seq(self, which: str) -> Tuple[Optional[Frame], int]:
+        """Return (jpeg, sequence) for 'front' or 'rear'; the sequence increments on every publish."""
+        if which == "front":
+            return self._front_latest
+        elif which == "rear":
+            return self._rear_latest
+        return None, 0
+
+    def wait_for_frame(
+        self, which: str, last_seq: Optional[int] = None, timeout: Optional[float] = None
+    ) -> Tuple[Optional[Frame], int]:
         """
-        Flask route helper:
-        return Response(camera_manager.mjpeg_generator("front"), mimetype="multipart/x-mixed-replace; boundary=frame")
+        Block until a frame newer than last_seq is published (or timeout).
+        Returns (jpeg, sequence); the sequence equals last_seq on timeout.
         """
-        placeholder = _make_blank_jpeg(f"{which.capitalize()} camera unavailable",
-                                       self.front_res if which == "front" else self.rear_res)
-        while True:
-            frame = self.get_latest_frame(which) or placeholder
-            yield (
-                b"--" + boundary.encode("ascii") + b"\r\n"
-                b"Content-Type: image/jpeg\r\n"
-                b"Content-Length: " + str(len(frame)).encode("ascii") + b"\r\n\r\n" +
-                frame + b"\r\n"
-            )
-            # 30 fps cap for MJPEG stream pacing (adjust if needed)
-            time.sleep(1 / 30.0)
+        if which == "front":
+            latest = self._front_latest
+            if latest[1] == last_seq or last_seq is None:
+                with self._front_frame_ready:
+                    last_seq = latest[1]
+                    self._front_frame_ready.wait_for(lambda: self._front_latest[1] != last_seq, timeout)
+            return self._front_latest
+        elif which == "rear":
+            latest = self._rear_latest
+            if latest[1] == last_seq or last_seq is None:
+                with self._rear_frame_ready:
+                    last_seq = latest[1]
+                    self._rear_frame_ready.wait_for(lambda: self._rear_latest[1] != last_seq, timeout)
+            return self._rear_latest
+        return None, 0
+
+    def frame_interval(self, which: str) -> float:
+        """Measured seconds between published frames (EWMA), seeded from the configured FPS."""
+        if which == "front":
+            return self._front_frame_interval
+        return self._rear_frame_interval
+
+    def _publish_frame(self, which: str, jpeg: Frame) -> None:
+        """Store the newest JPEG for a camera and wake any streams waiting on it."""
+        if not isinstance(jpeg, bytes):
+            # e.g. a buffer handed over by a Picamera2 encoder output
+            jpeg = bytes(jpeg)
+        now = time.monotonic()
+        if which == "front":
+            with self._front_frame_ready:
+                if self._front_published_at is not None:
+                    self._front_frame_interval += FRAME_INTERVAL_ALPHA * (
+                        (now - self._front_published_at) - self._front_frame_interval
+                    )
+                self._front_published_at = now
+                self._front_latest = (jpeg, self._front_latest[1] + 1)
+                self._front_frame_ready.notify_all()
+        else:
+            with self._rear_frame_ready:
+                if self._rear_published_at is not None:
+                    self._rear_frame_interval += FRAME_INTERVAL_ALPHA * (
+                        (now - self._rear_published_at) - self._rear_frame_interval
+                    )
+                self._rear_published_at = now
+                self._rear_latest = (jpeg, self._rear_latest[1] + 1)
+                self._rear_frame_ready.notify_all()
 
     # ---------------------- Probing ------------------------------------------
 
@@ -349,10 +689,13 @@ class CameraManager:
             if camera_id is not None:
                 kwargs["camera_num"] = int(camera_id)
             cam = Picamera2(**kwargs)
+            # Keep it open: the stream loop configures this same instance later
             if which == "front":
                 self.front_backend = "picamera2"
+                self._picam2, cam = cam, None
             else:
                 self.rear_backend = "picamera2"
+                self._rear_picam2, cam = cam, None
             logger.info(
                 "Picamera2 detected for %s camera (camera_id=%s).",
                 which,
@@ -375,13 +718,27 @@ class CameraManager:
                     pass
 
     def _probe_usb_camera(self, which: str) -> Tuple[bool, Optional[int]]:
-        """Try to open /dev/videoN devices to find a working USB camera."""
+        """Find a USB capture device, asking V4L2 what each node is before opening anything with OpenCV."""
+        indices = _usb_capture_indices()
+        if indices is not None:
+            if indices:
+                logger.info("%s camera will use /dev/video%d", which.capitalize(), indices[0])
+                return True, indices[0]
+            logger.info("No USB capture device found for %s camera.", which)
+            return False, None
+
+        # No sysfs/ioctl support; fall back to opening /dev/video[0-3] directly
         for idx in (0, 1, 2, 3):
             cap = cv2.VideoCapture(idx, cv2.CAP_V4L2)
             if not cap.isOpened():
                 cap.release()
                 continue
-            ok, _ = cap.read()
+            # Same capture mode the stream loop asks for, so the probe doesn't make the
+            # driver queue a full set of raw frames; grab() proves a frame arrived
+            # without spending time decoding it.
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+            ok = cap.grab()
             cap.release()
             if ok:
                 logger.info("%s camera will use /dev/video%d", which.capitalize(), idx)
@@ -446,9 +803,16 @@ class CameraManager:
         if src_props:
             src = f"{src} {' '.join(src_props)}"
         caps = f"video/x-raw,width={int(width)},height={int(height)},framerate={fps}/1"
+        # Flip before videoconvert, while the frame is still in the camera's (smaller) YUV
+        # format. A rear vflip is left to the encoder when TurboJPEG can read bottom-up.
+        flip = ""
+        if which == "front":
+            flip = "videoflip method=horizontal-flip ! "
+        elif self.rear_vflip and _turbojpeg is None:
+            flip = "videoflip method=vertical-flip ! "
         pipeline = (
-            f"{src} ! {caps} ! videoconvert ! video/x-raw,format=BGR ! "
-            "appsink drop=true max-buffers=1"
+            f"{src} ! {caps} ! {flip}videoconvert ! video/x-raw,format=BGR ! "
+            "appsink drop=true max-buffers=1 sync=false emit-signals=false"
         )
         return pipeline
 
@@ -464,6 +828,103 @@ class CameraManager:
         cap.release()
         return None
 
+    @staticmethod
+    def _grab_latest(cap: cv2.VideoCapture, frame_period: float, max_grabs: int = 4) -> bool:
+        """
+        Advance the capture to the newest frame without decoding the ones skipped.
+        Queued (stale) frames come back from grab() immediately; a fresh one makes it
+        block for roughly a frame period, which is where we stop.
+        """
+        for _ in range(max_grabs):
+            start = time.monotonic()
+            if not cap.grab():
+                return False
+            if time.monotonic() - start >= frame_period / 2:
+                break
+        return True
+
+    def _make_encoder(
+        self,
+        which: str,
+        quality: int,
+        flip_code: Optional[int],
+        from_request: bool = False,
+        yuv420: bool = False,
+    ) -> _FrameEncoder:
+        """
+        Encoder thread that resizes (if the source ignored our size), flips and publishes frames.
+        With from_request it is fed Picamera2 requests and encodes straight from the mapped
+        "main" buffer instead of from a copied array; with yuv420 that buffer is packed I420
+        at the configured size and is encoded as-is (see _configure_picamera2).
+        """
+        size = tuple(self.front_res if which == "front" else self.rear_res)
+        # Resize/flip write into buffers owned by this encoder and reused every frame;
+        # only the JPEG itself is newly allocated, since readers may still hold it.
+        scratch = {}
+        # libjpeg-turbo can read the rows bottom-up, which is a vertical flip for free
+        bottom_up = flip_code == 0 and _turbojpeg is not None
+
+        def _buffer(key: str, like: np.ndarray, shape: tuple) -> np.ndarray:
+            buf = scratch.get(key)
+            if buf is None or buf.shape != shape or buf.dtype != like.dtype:
+                buf = scratch[key] = np.empty(shape, dtype=like.dtype)
+            return buf
+
+        def encode(frame_bgr: np.ndarray) -> Optional[Frame]:
+            h, w = frame_bgr.shape[:2]
+            if (w, h) != size:
+                # Box filtering only pays off for real downscales; small mismatches and
+                # upscales get the ~2x cheaper bilinear filter.
+                if w >= 2 * size[0] and h >= 2 * size[1]:
+                    interpolation = cv2.INTER_AREA
+                else:
+                    interpolation = cv2.INTER_LINEAR
+                shape = (size[1], size[0]) + frame_bgr.shape[2:]
+                frame_bgr = cv2.resize(
+                    frame_bgr, size, dst=_buffer("resize", frame_bgr, shape), interpolation=interpolation
+                )
+            if flip_code is not None and not bottom_up:
+                frame_bgr = cv2.flip(frame_bgr, flip_code, dst=_buffer("flip", frame_bgr, frame_bgr.shape))
+            return _encode_jpeg(frame_bgr, quality, bottom_up)
+
+        if yuv420:
+            def encode(yuv: np.ndarray) -> Optional[Frame]:
+                return _encode_jpeg_yuv420(yuv, size, quality)
+
+        if from_request:
+            from picamera2 import MappedArray
+
+            encode_array = encode
+
+            def encode(request) -> Optional[Frame]:
+                with MappedArray(request, "main") as mapped:
+                    return encode_array(mapped.array)
+
+        return _FrameEncoder(
+            f"{which}-encoder", encode, functools.partial(self._publish_frame, which), ENCODER_CPUS.get(which)
+        )
+
+    @staticmethod
+    def _configure_picamera2(cam, size: Tuple[int, int], want_yuv: bool, **config_kwargs) -> bool:
+        """
+        Configure a Picamera2 video stream and return True if it delivers YUV420.
+        YUV420 moves half the bytes of RGB888 and skips the ISP's YUV->RGB step and the
+        encoder's RGB->YUV step, but is only kept when the planes come unpadded, which is
+        the layout libjpeg-turbo's YUV encoder reads; otherwise RGB888 (B,G,R in memory).
+        Six buffers leave the camera headroom while the encoder holds up to two requests.
+        """
+        size = tuple(size)
+        if want_yuv and size[0] % 8 == 0 and size[1] % 2 == 0:
+            cam.configure(cam.create_video_configuration(
+                main={"size": size, "format": "YUV420"}, buffer_count=6, **config_kwargs
+            ))
+            if cam.camera_configuration()["main"].get("stride") == size[0]:
+                return True
+        cam.configure(cam.create_video_configuration(
+            main={"size": size, "format": "RGB888"}, buffer_count=6, **config_kwargs
+        ))
+        return False
+
     # ---------------------- Front (Picamera2) thread -------------------------
 
     def _start_front_thread(self):
@@ -480,14 +941,14 @@ class CameraManager:
                 "Initializing Picamera2 (front, camera_id=%s)...",
                 self.front_camera_id if self.front_camera_id is not None else "default",
             )
-            target = self._front_loop
+            target = functools.partial(self._picamera2_loop, "front")
         elif backend == "gstreamer":
             pipeline = self._build_gstreamer_pipeline("front", self.front_camera_id)
             logger.info(
                 "Initializing libcamerasrc (front) via GStreamer pipeline: %s",
                 pipeline,
             )
-            target = self._front_loop_gstreamer
+            target = functools.partial(self._gstreamer_loop, "front")
         else:
             raise RuntimeError("Front camera backend not available")
 
@@ -504,17 +965,12 @@ class CameraManager:
         self._front_stop.set()
         self._front_thread.join(timeout=2.0)
         self._front_thread = None
-        # Close camera instance
+        # Stop streaming; the Picamera2 instance stays open for the next start
         if self.front_backend == "picamera2" and self._picam2 is not None:
             try:
                 self._picam2.stop()
             except Exception:
                 pass
-            try:
-                self._picam2.close()
-            except Exception:
-                pass
-            self._picam2 = None
         elif self.front_backend == "gstreamer" and self._front_cap is not None:
             try:
                 self._front_cap.release()
@@ -524,112 +980,171 @@ class CameraManager:
         self.front_active = False
         logger.info("Front camera stopped.")
 
-    def _front_loop(self):
+    def _picamera2_loop(self, which: str):
+        """Capture loop for a CSI camera driven through Picamera2 (front or rear)."""
+        front = which == "front"
+        picam_attr = "_picam2" if front else "_rear_picam2"
+        stop = self._front_stop if front else self._rear_stop
+        cam = None
+        encoder = None
+        hw_encoder = None
+        crashed = False
         try:
             from picamera2 import Picamera2
+            camera_id = self.front_camera_id if front else self.rear_camera_id
             kwargs = {}
-            if self.front_camera_id is not None:
-                kwargs["camera_num"] = int(self.front_camera_id)
-            self._picam2 = Picamera2(**kwargs)
+            if camera_id is not None:
+                kwargs["camera_num"] = int(camera_id)
+            # Reuse the instance opened by the probe or a previous run: reconfiguring an
+            # open camera is much faster than reopening it (e.g. on a profile change).
+            cam = getattr(self, picam_attr)
+            if cam is None:
+                cam = Picamera2(**kwargs)
+                setattr(self, picam_attr, cam)
+
+            if front:
+                # Mirror horizontally so the feed matches the actual orientation
+                res, fps, quality = self.front_res, self.front_fps, self.front_quality
+                use_hw_encoder, flip, flip_code = self.front_hw_encoder, {"hflip": 1}, 1
+            else:
+                res, fps, quality = self.rear_res, self.rear_fps, self.rear_quality
+                use_hw_encoder, flip_code = self.rear_hw_encoder, 0
+                flip = {"vflip": 1} if self.rear_vflip else None
 
             # Configure for streaming video
-            # Use RGB888 to avoid color surprises; convert to BGR for OpenCV JPEG encode.
-            video_config = self._picam2.create_video_configuration(
-                main={"size": tuple(self.front_res), "format": "RGB888"},
-                buffer_count=4,
+            # libcamera names formats by word order, so "RGB888" is B,G,R in memory: exactly
+            # the layout TJPF_BGR / cv2.imencode consume, with no channel swap. ("BGR888"
+            # would be R,G,B in memory and come out with red and blue swapped.)
+            config_kwargs = {}
+            sw_flip = False
+            if flip:
+                try:
+                    # Let the ISP flip the image so the loop never copies a frame to flip it
+                    from libcamera import Transform
+                    config_kwargs["transform"] = Transform(**flip)
+                except ImportError:
+                    sw_flip = True
+
+            if use_hw_encoder and not sw_flip:
+                hw_encoder = self._open_hw_mjpeg_encoder()
+            if hw_encoder is not None:
+                if self._record_hw_mjpeg(cam, which, hw_encoder, stop, **config_kwargs):
+                    return
+                hw_encoder = None  # could not start; fall through to the software path
+
+            yuv420 = self._configure_picamera2(
+                cam, res, _turbojpeg is not None and not sw_flip, **config_kwargs
             )
-            self._picam2.configure(video_config)
-            self._picam2.start()
-
-            target_delay = 1.0 / max(1, self.front_fps)
-            quality = int(self.front_quality)
+            cam.start()
 
-            while not self._front_stop.is_set():
-                t0 = time.time()
-                frame_rgb = self._picam2.capture_array()
+            target_delay = 1.0 / max(1, fps)
+            encoder = self._make_encoder(
+                which, int(quality), flip_code if sw_flip else None, from_request=True, yuv420=yuv420
+            )
+            encoder.start()
+
+            # Bound once so the per-frame loop only touches locals
+            stopped, capture_request, submit = stop.is_set, cam.capture_request, encoder.submit
+            next_deadline = time.monotonic()
+            while not stopped():
+                # Hand the request itself to the encoder, which encodes from the mapped
+                # DMA buffer and releases it back to the camera; no per-frame array copy.
+                request = capture_request()
                 # Robustness: sometimes None may occur if pipeline hiccups
-                if frame_rgb is None or not isinstance(frame_rgb, np.ndarray):
+                if request is None:
                     time.sleep(0.01)
                     continue
 
-                # Picamera2 returns frames that are already in BGR order for JPEG encoding.
-                # Avoid swapping channels so the streamed colours remain natural.
-                frame_bgr = np.ascontiguousarray(frame_rgb)
-
-                # Flip horizontally so the feed mirrors the actual orientation
-                frame_bgr = cv2.flip(frame_bgr, 1)
-                ok, buf = cv2.imencode(".jpg", frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
-                if ok:
-                    with self._front_lock:
-                        self._front_last_jpeg = buf.tobytes()
+                submit(request, request.release)
 
-                # Pace loop to approximate requested FPS
-                elapsed = time.time() - t0
-                if elapsed < target_delay:
-                    time.sleep(target_delay - elapsed)
+                # Pace loop to the requested FPS on a fixed-rate schedule
+                next_deadline = _sleep_until(next_deadline + target_delay, target_delay)
 
         except Exception:
-            logger.exception("Front camera loop crashed")
+            logger.exception("%s camera Picamera2 loop crashed", which.capitalize())
+            crashed = True
         finally:
+            if encoder is not None:
+                encoder.stop()
             # Ensure hardware is released
             try:
-                if self._picam2 is not None:
-                    self._picam2.stop()
+                if cam is not None:
+                    cam.stop()
             except Exception:
                 pass
             try:
-                if self._picam2 is not None:
-                    self._picam2.close()
+                if cam is not None and hw_encoder is not None:
+                    cam.stop_encoder()
             except Exception:
                 pass
-            self._picam2 = None
-            self.front_active = False
+            # Keep the camera open for the next start unless it is what failed
+            if crashed:
+                try:
+                    if cam is not None:
+                        cam.close()
+                except Exception:
+                    pass
+                setattr(self, picam_attr, None)
+            if front:
+                self.front_active = False
+            else:
+                self.rear_active = False
 
-    def _front_loop_gstreamer(self):
-        cap = None
+    def _record_hw_mjpeg(self, cam, which: str, hw_encoder, stop: threading.Event, **config_kwargs) -> bool:
+        """
+        Stream through the hardware MJPEG encoder until stop is set. Frames go
+        sensor -> ISP -> MJPEG block -> _publish_frame without touching numpy or the
+        CPU-side JPEG encoder. Returns False, with the camera stopped, if recording
+        could not be started, so the caller can fall back to software encoding.
+        """
+        if which == "front":
+            size, fps, quality = self.front_res, self.front_fps, self.front_quality
+        else:
+            size, fps, quality = self.rear_res, self.rear_fps, self.rear_quality
+        # The encoder takes YUV420 natively and paces itself to the sensor
+        video_config = cam.create_video_configuration(
+            main={"size": tuple(size), "format": "YUV420"},
+            buffer_count=4,
+            controls={"FrameRate": float(fps)},
+            **config_kwargs,
+        )
         try:
-            pipeline = self._build_gstreamer_pipeline("front", self.front_camera_id)
-            cap = self._open_gstreamer_capture(pipeline)
-            if cap is None or not cap.isOpened():
-                logger.error("Failed to open GStreamer pipeline for front camera: %s", pipeline)
-                return
-
-            self._front_cap = cap
-            target_delay = 1.0 / max(1, self.front_fps)
-            quality = int(self.front_quality)
-
-            while not self._front_stop.is_set():
-                t0 = time.time()
-                ok, frame_bgr = cap.read()
-                if not ok or frame_bgr is None:
-                    time.sleep(0.02)
-                    continue
-
-                frame_bgr = np.ascontiguousarray(frame_bgr)
-                h, w = frame_bgr.shape[:2]
-                if (w, h) != tuple(self.front_res):
-                    frame_bgr = cv2.resize(frame_bgr, self.front_res, interpolation=cv2.INTER_AREA)
-
-                frame_bgr = cv2.flip(frame_bgr, 1)
-                ok, buf = cv2.imencode(".jpg", frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
-                if ok:
-                    with self._front_lock:
-                        self._front_last_jpeg = buf.tobytes()
-
-                elapsed = time.time() - t0
-                if elapsed < target_delay:
-                    time.sleep(target_delay - elapsed)
+            cam.configure(video_config)
+            cam.start_recording(
+                hw_encoder,
+                _publish_output(functools.partial(self._publish_frame, which)),
+                quality=_picamera2_quality(int(quality)),
+            )
+        except Exception as exc:
+            logger.warning(
+                "%s camera: hardware MJPEG encoder failed to start (%s); encoding in software.",
+                which.capitalize(),
+                exc,
+            )
+            for cleanup in (cam.stop_recording, cam.stop):
+                try:
+                    cleanup()
+                except Exception:
+                    pass
+            return False
+        logger.info("%s camera using the hardware MJPEG encoder.", which.capitalize())
+        stop.wait()
+        return True
 
-        except Exception:
-            logger.exception("Front camera GStreamer loop crashed")
-        finally:
-            try:
-                if cap is not None:
-                    cap.release()
-            except Exception:
-                pass
-            self._front_cap = None
-            self.front_active = False
+    @staticmethod
+    def _open_hw_mjpeg_encoder():
+        """Picamera2's V4L2 MJPEG encoder, or None where there is no hardware encoder (e.g. Pi 5)."""
+        try:
+            # picamera2.encoders.MJPEGEncoder is aliased to the FFmpeg software encoder
+            # on boards without the VideoCore block, so import the V4L2 class itself.
+            from picamera2 import encoders
+            if not getattr(encoders, "_hw_encoder_available", True):
+                raise RuntimeError("no hardware video encoder on this board")
+            from picamera2.encoders.mjpeg_encoder import MJPEGEncoder
+            return MJPEGEncoder()
+        except Exception as exc:
+            logger.info("Hardware MJPEG encoder unavailable (%s); encoding in software.", exc)
+            return None
 
     # ---------------------- Rear camera thread -------------------------------
 
@@ -645,14 +1160,14 @@ class CameraManager:
                     "Initializing Picamera2 (rear, camera_id=%s)...",
                     self.rear_camera_id if self.rear_camera_id is not None else "default",
                 )
-                target = self._rear_loop_picamera2
+                target = functools.partial(self._picamera2_loop, "rear")
             elif backend == "gstreamer":
                 pipeline = self._build_gstreamer_pipeline("rear", self.rear_camera_id)
                 logger.info(
                     "Initializing libcamerasrc (rear) via GStreamer pipeline: %s",
                     pipeline,
                 )
-                target = self._rear_loop_gstreamer
+                target = functools.partial(self._gstreamer_loop, "rear")
             else:
                 raise RuntimeError("Rear camera backend not available")
         elif self.rear_type == "usb":
@@ -682,11 +1197,6 @@ class CameraManager:
                     self._rear_picam2.stop()
                 except Exception:
                     pass
-                try:
-                    self._rear_picam2.close()
-                except Exception:
-                    pass
-                self._rear_picam2 = None
             elif self.rear_backend == "gstreamer" and self._rear_cap is not None:
                 try:
                     self._rear_cap.release()
@@ -706,10 +1216,19 @@ class CameraManager:
 
     def _rear_loop_usb(self):
         cap = None
+        encoder = None
         try:
             cap = cv2.VideoCapture(self._rear_index, cv2.CAP_V4L2)
             self._rear_cap = cap
 
+            # Keep the driver queue short so we are never serving a backlog
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+            # Most UVC webcams emit MJPEG natively; ask for it before sizing so the
+            # driver doesn't settle on (slower, bandwidth-bound) raw YUYV modes.
+            mjpg = cv2.VideoWriter_fourcc(*"MJPG")
+            cap.set(cv2.CAP_PROP_FOURCC, mjpg)
+
             # Try to set requested resolution/fps; ignore failures
             cap.set(cv2.CAP_PROP_FRAME_WIDTH, int(self.rear_res[0]))
             cap.set(cv2.CAP_PROP_FRAME_HEIGHT, int(self.rear_res[1]))
@@ -717,35 +1236,63 @@ class CameraManager:
 
             target_delay = 1.0 / max(1, self.rear_fps)
             quality = int(self.rear_quality)
-
-            while not self._rear_stop.is_set():
-                t0 = time.time()
-                ok, frame_bgr = cap.read()
+            device_fps = cap.get(cv2.CAP_PROP_FPS) or float(self.rear_fps)
+            device_period = 1.0 / max(1.0, device_fps)
+
+            is_mjpg = int(cap.get(cv2.CAP_PROP_FOURCC)) == mjpg
+            if not is_mjpg:
+                logger.info("Rear USB camera does not offer MJPG; using its default pixel format.")
+
+            # When the camera already delivers JPEGs at the size we want and no flip
+            # is needed, forward its buffers as-is instead of decoding and re-encoding.
+            device_res = (
+                int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            )
+            passthrough = (
+                is_mjpg
+                and device_res == tuple(self.rear_res)
+                and not self.rear_vflip
+                and cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+            )
+            if device_res != tuple(self.rear_res):
+                logger.warning(
+                    "Rear USB camera delivers %dx%d instead of %dx%d; frames will be resized in software.",
+                    *device_res, *self.rear_res,
+                )
+            if passthrough:
+                logger.info("Rear USB camera: forwarding native MJPEG at %dx%d.", *device_res)
+            else:
+                encoder = self._make_encoder("rear", quality, 0 if self.rear_vflip else None)
+                encoder.start()
+
+            stopped, grab_latest, retrieve = self._rear_stop.is_set, self._grab_latest, cap.retrieve
+            submit = encoder.submit if encoder is not None else None
+            next_deadline = time.monotonic()
+            while not stopped():
+                ok = grab_latest(cap, device_period)
+                frame_bgr = None
+                if ok:
+                    ok, frame_bgr = retrieve()
                 if not ok or frame_bgr is None:
                     # Camera hiccup; small backoff
                     time.sleep(0.01)
                     continue
 
-                # Optionally resize to requested resolution if device ignored set()
-                h, w = frame_bgr.shape[:2]
-                if (w, h) != tuple(self.rear_res):
-                    frame_bgr = cv2.resize(frame_bgr, self.rear_res, interpolation=cv2.INTER_AREA)
-
-                frame_bgr = cv2.flip(frame_bgr, 0)
-
-                ok, buf = cv2.imencode(".jpg", frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
-                if ok:
-                    with self._rear_lock:
-                        self._rear_last_jpeg = buf.tobytes()
+                if passthrough:
+                    # frame_bgr is the undecoded JPEG as a 1xN byte array
+                    self._publish_frame("rear", frame_bgr.tobytes())
+                else:
+                    submit(frame_bgr)
 
                 # Pace
-                elapsed = time.time() - t0
-                if elapsed < target_delay:
-                    time.sleep(target_delay - elapsed)
+                next_deadline = _sleep_until(next_deadline + target_delay, target_delay)
 
         except Exception:
             logger.exception("Rear camera USB loop crashed")
         finally:
+            if encoder is not None:
+                encoder.stop()
             try:
                 if cap is not None:
                     cap.release()
@@ -754,103 +1301,66 @@ class CameraManager:
             self._rear_cap = None
             self.rear_active = False
 
-    def _rear_loop_picamera2(self):
-        try:
-            from picamera2 import Picamera2
-            kwargs = {}
-            if self.rear_camera_id is not None:
-                kwargs["camera_num"] = int(self.rear_camera_id)
-            self._rear_picam2 = Picamera2(**kwargs)
-
-            video_config = self._rear_picam2.create_video_configuration(
-                main={"size": tuple(self.rear_res), "format": "RGB888"},
-                buffer_count=4,
-            )
-            self._rear_picam2.configure(video_config)
-            self._rear_picam2.start()
-
-            target_delay = 1.0 / max(1, self.rear_fps)
-            quality = int(self.rear_quality)
-
-            while not self._rear_stop.is_set():
-                t0 = time.time()
-                frame_rgb = self._rear_picam2.capture_array()
-                if frame_rgb is None or not isinstance(frame_rgb, np.ndarray):
-                    time.sleep(0.01)
-                    continue
-
-                frame_bgr = np.ascontiguousarray(frame_rgb)
-                frame_bgr = cv2.flip(frame_bgr, 0)
-
-                ok, buf = cv2.imencode(".jpg", frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
-                if ok:
-                    with self._rear_lock:
-                        self._rear_last_jpeg = buf.tobytes()
-
-                elapsed = time.time() - t0
-                if elapsed < target_delay:
-                    time.sleep(target_delay - elapsed)
-
-        except Exception:
-            logger.exception("Rear camera Picamera2 loop crashed")
-        finally:
-            try:
-                if self._rear_picam2 is not None:
-                    self._rear_picam2.stop()
-            except Exception:
-                pass
-            try:
-                if self._rear_picam2 is not None:
-                    self._rear_picam2.close()
-            except Exception:
-                pass
-            self._rear_picam2 = None
-            self.rear_active = False
-
-    def _rear_loop_gstreamer(self):
+    def _gstreamer_loop(self, which: str):
+        """Capture loop for a libcamerasrc pipeline (front or rear) opened through OpenCV."""
+        front = which == "front"
+        stop = self._front_stop if front else self._rear_stop
         cap = None
+        encoder = None
         try:
-            pipeline = self._build_gstreamer_pipeline("rear", self.rear_camera_id)
+            camera_id = self.front_camera_id if front else self.rear_camera_id
+            pipeline = self._build_gstreamer_pipeline(which, camera_id)
             cap = self._open_gstreamer_capture(pipeline)
             if cap is None or not cap.isOpened():
-                logger.error("Failed to open GStreamer pipeline for rear camera: %s", pipeline)
+                logger.error("Failed to open GStreamer pipeline for %s camera: %s", which, pipeline)
                 return
 
-            self._rear_cap = cap
-            target_delay = 1.0 / max(1, self.rear_fps)
-            quality = int(self.rear_quality)
-
-            while not self._rear_stop.is_set():
-                t0 = time.time()
-                ok, frame_bgr = cap.read()
+            if front:
+                self._front_cap = cap
+                # The pipeline mirrors the frame (see _build_gstreamer_pipeline)
+                res, fps, quality, flip_code = self.front_res, self.front_fps, self.front_quality, None
+            else:
+                self._rear_cap = cap
+                res, fps, quality = self.rear_res, self.rear_fps, self.rear_quality
+                flip_code = 0 if self.rear_vflip and _turbojpeg is not None else None
+            # The caps filter makes libcamerasrc negotiate this size with the ISP, which
+            # scales on the hardware; the encoder only resizes if that did not stick.
+            device_res = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            if all(device_res) and device_res != tuple(res):
+                logger.warning(
+                    "%s GStreamer pipeline delivers %dx%d instead of %dx%d; frames will be resized in software.",
+                    which.capitalize(), *device_res, *res,
+                )
+            target_delay = 1.0 / max(1, fps)
+            encoder = self._make_encoder(which, int(quality), flip_code)
+            encoder.start()
+
+            stopped, read, submit = stop.is_set, cap.read, encoder.submit
+            next_deadline = time.monotonic()
+            while not stopped():
+                ok, frame_bgr = read()
                 if not ok or frame_bgr is None:
                     time.sleep(0.02)
                     continue
 
-                frame_bgr = np.ascontiguousarray(frame_bgr)
-                h, w = frame_bgr.shape[:2]
-                if (w, h) != tuple(self.rear_res):
-                    frame_bgr = cv2.resize(frame_bgr, self.rear_res, interpolation=cv2.INTER_AREA)
-
-                frame_bgr = cv2.flip(frame_bgr, 0)
-
-                ok, buf = cv2.imencode(".jpg", frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
-                if ok:
-                    with self._rear_lock:
-                        self._rear_last_jpeg = buf.tobytes()
+                submit(frame_bgr)
 
-                elapsed = time.time() - t0
-                if elapsed < target_delay:
-                    time.sleep(target_delay - elapsed)
+                next_deadline = _sleep_until(next_deadline + target_delay, target_delay)
 
         except Exception:
-            logger.exception("Rear camera GStreamer loop crashed")
+            logger.exception("%s camera GStreamer loop crashed", which.capitalize())
         finally:
+            if encoder is not None:
+                encoder.stop()
             try:
                 if cap is not None:
                     cap.release()
             except Exception:
                 pass
-            self._rear_cap = None
-            self.rear_active = False
+            if front:
+                self._front_cap = None
+                self.front_active = False
+            else:
+                self._rear_cap = None
+                self.rear_active = False
 
@@ -1,86 +1,100 @@
 # config_manager.py - Configuration management
 
+import copy
 import json
 import os
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# Default configuration, used when no config file exists or it cannot be read
+_DEFAULT_CONFIG = {
+    "system": {
+        "log_level": "INFO"
+    },
+    "cameras": {
+        "front": {
+            "type": "picamera2",
+            "camera_id": 0,
+            "resolution": [768, 432],
+            "fps": 24,
+            "quality": 78
+        },
+        "rear": {
+            "type": "usb",
+            "camera_id": 1,
+            "resolution": [320, 240],
+            "fps": 20,
+            "quality": 70
+        }
+    },
+    "motors": {
+        "i2c_address": "0x34",
+        "i2c_baudrate": 400000,
+        "max_speed": 100,
+        "left_channel": 2,
+        "right_channel": 3,
+        "left_trim": 1.0,
+        "right_trim": 1.0,
+    },
+    "battery": {
+        "voltage_register": "0x00",
+        "voltage_scale": 0.001,
+        "divider_ratio": 1.0,
+        "cells": 3,
+        "warn_cell_voltage": 3.5,
+        "critical_cell_voltage": 3.3,
+        "full_voltage": 12.3,
+        "empty_voltage": 9.9,
+        "ema_alpha": 0.2
+    },
+    "encoders": {
+        "total_register": "0x3C",
+        "total_count": 4,
+        "left_indices": [0, 2],
+        "right_indices": [1, 3],
+        "left_register": None,
+        "right_register": None,
+        "reset_register": "0x3A",
+        "reset_value": 1,
+        "counts_per_revolution": 44,
+        "wheel_diameter_in": 2.6,
+        "track_width_in": 7.5,
+        "gear_ratio": 90.0,
+        "max_path_points": 800
+    },
+    "lighting": {
+        "led_bar": {
+            "pin": 12,
+            "default_state": False
+        }
+    }
+}
+
+
 class ConfigManager:
     def __init__(self, config_file="config/crawler_config.json"):
         self.logger = logging.getLogger(__name__)
         self.config_file = config_file
+        self._config_dir = os.path.dirname(config_file)
+        self._dir_ensured = not self._config_dir  # a bare filename lives in the cwd
         self.config = self._load_config()
     
     def _load_config(self):
         """Load configuration or use defaults"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson is not None else json.loads(data)
         except Exception as e:
             self.logger.error(f"Failed to load config: {e}")
         
-        # Return default configuration
-        return {
-            "system": {
-                "log_level": "INFO"
-            },
-            "cameras": {
-                "front": {
-                    "type": "picamera2",
-                    "camera_id": 0,
-                    "resolution": [768, 432],
-                    "fps": 24,
-                    "quality": 78
-                },
-                "rear": {
-                    "type": "usb",
-                    "camera_id": 1,
-                    "resolution": [320, 240],
-                    "fps": 20,
-                    "quality": 70
-                }
-            },
-            "motors": {
-                "i2c_address": "0x34",
-                "max_speed": 100,
-                "left_channel": 2,
-                "right_channel": 3,
-                "left_trim": 1.0,
-                "right_trim": 1.0,
-            },
-            "battery": {
-                "voltage_register": "0x00",
-                "voltage_scale": 0.001,
-                "divider_ratio": 1.0,
-                "cells": 3,
-                "warn_cell_voltage": 3.5,
-                "critical_cell_voltage": 3.3,
-                "full_voltage": 12.3,
-                "empty_voltage": 9.9,
-                "ema_alpha": 0.2
-            },
-            "encoders": {
-                "total_register": "0x3C",
-                "total_count": 4,
-                "left_indices": [0, 2],
-                "right_indices": [1, 3],
-                "left_register": None,
-                "right_register": None,
-                "reset_register": "0x3A",
-                "reset_value": 1,
-                "counts_per_revolution": 44,
-                "wheel_diameter_in": 2.6,
-                "track_width_in": 7.5,
-                "gear_ratio": 90.0,
-                "max_path_points": 800
-            },
-            "lighting": {
-                "led_bar": {
-                    "pin": 12,
-                    "default_state": False
-                }
-            }
-        }
+        # Fall back to a fresh copy of the defaults
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
     def get_config(self):
         return self.config
@@ -88,9 +102,16 @@ class ConfigManager:
     def save_config(self):
         """Save current configuration to file"""
         try:
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if not self._dir_ensured:
+                os.makedirs(self._config_dir, exist_ok=True)
+                self._dir_ensured = True
+            # Serialize first so the file is written in one call
+            if orjson is not None:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode("utf-8")
+            with open(self.config_file, 'wb') as f:
+                f.write(data)
             self.logger.info("Configuration saved")
         except Exception as e:
             self.logger.error(f"Failed to save config: {e}")
@@ -10,6 +10,13 @@ import psutil
 from smbus2 import SMBus
 
 MOTOR_SPEED_REGISTER_BASE = 0x33
+# Bus 1's configured SCL rate (big-endian u32 from the device tree)
+I2C_CLOCK_FREQUENCY_PATH = "/sys/class/i2c-adapter/i2c-1/of_node/clock-frequency"
+# Little-endian signed 32-bit encoder counters
+_INT32 = struct.Struct("<i")
+_INT32_PAIR = struct.Struct("<ii")
+# get_status reuses CPU/memory figures and telemetry battery readings this recent (seconds)
+SYSTEM_STATS_TTL = 1.0
 
 logger = logging.getLogger("utils")
 
@@ -22,6 +29,8 @@ class HardwareManager:
         self.left_channel = int(motors_config.get("left_channel", 0))
         self.right_channel = int(motors_config.get("right_channel", 1))
         self.max_speed = int(motors_config.get("max_speed", 100))
+        # Expected bus clock (Hz); the rate itself is set by dtparam=i2c_arm_baudrate at boot
+        self.i2c_baudrate = int(motors_config.get("i2c_baudrate", 0) or 0)
         self.left_trim = self._parse_trim(motors_config.get("left_trim", 1.0), label="left")
         self.right_trim = self._parse_trim(motors_config.get("right_trim", 1.0), label="right")
         self.speed_register_base = MOTOR_SPEED_REGISTER_BASE
@@ -34,7 +43,19 @@ class HardwareManager:
             self.right_channel,
             self.right_speed_register,
         )
+        # Adjacent speed registers are written in one auto-incrementing block transfer
+        if self.right_speed_register == self.left_speed_register + 1:
+            self._speed_block_register, self._left_first = self.left_speed_register, True
+        elif self.left_speed_register == self.right_speed_register + 1:
+            self._speed_block_register, self._left_first = self.right_speed_register, False
+        else:
+            self._speed_block_register, self._left_first = None, True
         self.bus = None
+        # (left, right) bytes last written successfully; identical commands skip the bus.
+        # The hub and the return-to-start worker both drive the motors, so the
+        # compare, write and record happen under one lock.
+        self._motor_lock = threading.Lock()
+        self._written_output = None
         self.left_speed = 0
         self.right_speed = 0
 
@@ -59,6 +80,12 @@ class HardwareManager:
         self.critical_cell_voltage = float(self.battery_config.get("critical_cell_voltage", 0))
         self.battery_alpha = float(self.battery_config.get("ema_alpha", 0.3))
         self._battery_voltage = None
+        # Percent per volt above empty; None when full/empty do not define a range
+        self._battery_percent_per_volt = (
+            100.0 / (self.battery_full - self.battery_empty)
+            if self.battery_full > self.battery_empty
+            else None
+        )
 
         self.encoder_config = self.config.get("encoders", {})
         self.left_encoder_register = self._parse_register(
@@ -73,6 +100,13 @@ class HardwareManager:
         self.encoder_reset_register = self._parse_register(
             self.encoder_config.get("reset_register")
         )
+        # Back-to-back 32-bit left/right counters are fetched in one 8-byte read
+        self._encoder_pair_register, self._encoder_left_first = None, True
+        if self.left_encoder_register is not None and self.right_encoder_register is not None:
+            if self.right_encoder_register == self.left_encoder_register + 4:
+                self._encoder_pair_register = self.left_encoder_register
+            elif self.left_encoder_register == self.right_encoder_register + 4:
+                self._encoder_pair_register, self._encoder_left_first = self.right_encoder_register, False
         reset_value = self._parse_register(self.encoder_config.get("reset_value"))
         self.encoder_reset_value = reset_value if reset_value is not None else 0
 
@@ -87,6 +121,14 @@ class HardwareManager:
             or self._infer_total_count(self.encoder_left_indices, self.encoder_right_indices)
             or 0
         )
+        self._encoder_total_struct = struct.Struct("<" + "i" * max(0, self.encoder_total_count))
+        # Indices that exist in the block, resolved once rather than re-checked on every read
+        self._encoder_left_slots = tuple(
+            i for i in self.encoder_left_indices if 0 <= i < self.encoder_total_count
+        )
+        self._encoder_right_slots = tuple(
+            i for i in self.encoder_right_indices if 0 <= i < self.encoder_total_count
+        )
 
         counts_per_rev = float(self.encoder_config.get("counts_per_revolution", 0) or 0)
         gear_ratio = float(self.encoder_config.get("gear_ratio", 1.0) or 1.0)
@@ -106,16 +148,34 @@ class HardwareManager:
         self._last_command_time = None
         self._log_lock = threading.Lock()
         self._return_lock = threading.Lock()
+        # Telemetry samples run on a worker thread; this keeps pose updates and resets atomic
+        self._odometry_lock = threading.Lock()
         self._return_abort = None
         self.returning_to_start = False
 
         max_path_points = int(self.encoder_config.get("max_path_points", 600) or 600)
         self.path_points = deque(maxlen=max(2, max_path_points))
         self.path_points.append({"x": 0.0, "y": 0.0})
+        # Bumped after every path change; snapshots share a cached (version, list) copy
+        self._path_version = 0
+        self._path_list = None
         self.last_encoder_counts = None
-        self.odometry_pose = {"x": 0.0, "y": 0.0, "heading": 0.0}
+        # Pose in inches/radians; the snapshot dict is only built in _odometry_snapshot
+        self.pose_x_in = 0.0
+        self.pose_y_in = 0.0
+        self.pose_heading = 0.0
         self.total_distance_ft = 0.0
         self.odometry_sequence = 0
+        # (monotonic timestamp, telemetry dict) from the last get_telemetry();
+        # replaced wholesale so readers never need a lock.
+        self._latest_telemetry = None
+        # (monotonic timestamp, battery status) as read by get_telemetry(); kept apart
+        # because _republish_telemetry() re-stamps the snapshot without a new reading.
+        self._battery_sample = None
+        # (monotonic timestamp, {"cpu", "mem"}) for get_status, same pattern as above
+        self._system_stats = None
+        # The first cpu_percent(interval=None) call only sets the baseline and returns 0.0
+        psutil.cpu_percent(interval=None)
 
         self.odometry_enabled = (
             self.distance_per_tick_in > 0
@@ -144,6 +204,26 @@ class HardwareManager:
         except Exception:
             logger.exception("Failed to initialize I2C bus")
             self.bus = None
+            return
+        self._check_i2c_clock()
+
+    def _check_i2c_clock(self):
+        """Log the bus clock and warn when it is slower than motors.i2c_baudrate."""
+        try:
+            with open(I2C_CLOCK_FREQUENCY_PATH, "rb") as f:
+                clock_hz = struct.unpack(">I", f.read(4))[0]
+        except (OSError, struct.error):
+            logger.debug("I2C clock frequency not readable from %s", I2C_CLOCK_FREQUENCY_PATH)
+            return
+        logger.info("I2C bus clock: %d Hz", clock_hz)
+        if self.i2c_baudrate and clock_hz < self.i2c_baudrate:
+            logger.warning(
+                "I2C bus runs at %d Hz but motors.i2c_baudrate is %d; add "
+                "'dtparam=i2c_arm_baudrate=%d' to the boot config.txt and reboot",
+                clock_hz,
+                self.i2c_baudrate,
+                self.i2c_baudrate,
+            )
 
     def _clamp(self, value, lo, hi):
         return max(lo, min(hi, value))
@@ -238,19 +318,35 @@ class HardwareManager:
         right_output = self._clamp(int(round(right_speed * self.right_trim)), -self.max_speed, self.max_speed)
 
         # Example mapping: write signed speeds to two registers (adjust to your controller)
-        if self.bus is None:
+        bus = self.bus
+        if bus is None:
             return
 
-        try:
-            # Convert -100..100 to 0..200 then shift to signed domain in controller as needed.
-            # If your controller expects signed bytes directly: wrap to 0..255 with & 0xFF.
-            self.bus.write_byte_data(self.i2c_address, self.left_speed_register, left_output & 0xFF)
-            self.bus.write_byte_data(self.i2c_address, self.right_speed_register, right_output & 0xFF)
-        except Exception:
-            logger.exception("Failed writing motor speeds over I2C")
+        # Convert -100..100 to 0..200 then shift to signed domain in controller as needed.
+        # If your controller expects signed bytes directly: wrap to 0..255 with & 0xFF.
+        output = (left_output & 0xFF, right_output & 0xFF)
+        addr = self.i2c_address
+        with self._motor_lock:
+            if output == self._written_output:
+                # A held stick repeats the same command; the controller already has it
+                return
+            try:
+                if self._speed_block_register is not None:
+                    pair = list(output) if self._left_first else [output[1], output[0]]
+                    bus.write_i2c_block_data(addr, self._speed_block_register, pair)
+                else:
+                    bus.write_byte_data(addr, self.left_speed_register, output[0])
+                    bus.write_byte_data(addr, self.right_speed_register, output[1])
+                self._written_output = output
+            except Exception:
+                self._written_output = None
+                logger.exception("Failed writing motor speeds over I2C")
 
     def emergency_stop(self):
         try:
+            # Always reach the bus, even if a stop was the last command written
+            with self._motor_lock:
+                self._written_output = None
             self.set_motor_speed(0, 0)
             logger.info("Emergency stop issued.")
         except Exception:
@@ -258,13 +354,11 @@ class HardwareManager:
 
     def get_status(self):
         try:
-            cpu = psutil.cpu_percent(interval=None)
-            mem = psutil.virtual_memory().percent
             status = {
                 "motors": {"left": self.left_speed, "right": self.right_speed},
-                "system": {"cpu": cpu, "mem": mem},
+                "system": self._system_snapshot(),
             }
-            battery = self.get_battery_status()
+            battery = self._recent_battery_status()
             if battery:
                 status["battery"] = battery
             status["odometry"] = self._odometry_snapshot()
@@ -273,12 +367,33 @@ class HardwareManager:
             logger.exception("Status read failed")
             return {"motors": {"left": 0, "right": 0}, "system": {}}
 
+    def _system_snapshot(self):
+        """CPU/memory usage, re-read from /proc at most once per SYSTEM_STATS_TTL."""
+        now = time.monotonic()
+        cached = self._system_stats
+        if cached is not None and now - cached[0] < SYSTEM_STATS_TTL:
+            return cached[1]
+        stats = {
+            "cpu": psutil.cpu_percent(interval=None),
+            "mem": psutil.virtual_memory().percent,
+        }
+        self._system_stats = (now, stats)
+        return stats
+
+    def _recent_battery_status(self):
+        """Battery status from the last telemetry reading if fresh, else read over I2C."""
+        sample = self._battery_sample
+        if sample is not None and time.monotonic() - sample[0] < SYSTEM_STATS_TTL:
+            return sample[1]
+        return self.get_battery_status()
+
     def get_telemetry(self):
         telemetry = {
             "motors": {"left": self.left_speed, "right": self.right_speed},
         }
 
         battery = self.get_battery_status()
+        self._battery_sample = (time.monotonic(), battery)
         if battery:
             telemetry["battery"] = battery
 
@@ -287,8 +402,25 @@ class HardwareManager:
         else:
             telemetry["odometry"] = self._odometry_snapshot()
 
+        self._latest_telemetry = (time.monotonic(), telemetry)
         return telemetry
 
+    def get_telemetry_snapshot(self):
+        """Return the most recently published telemetry without touching the I2C bus."""
+        latest = self._latest_telemetry
+        if latest is None:
+            return self.get_telemetry()
+        return latest[1]
+
+    def _republish_telemetry(self):
+        # Refresh motor/odometry fields of the published snapshot after a local
+        # state change (reset, return-to-start) without new bus reads.
+        latest = self._latest_telemetry
+        telemetry = dict(latest[1]) if latest else {}
+        telemetry["motors"] = {"left": self.left_speed, "right": self.right_speed}
+        telemetry["odometry"] = self._odometry_snapshot()
+        self._latest_telemetry = (time.monotonic(), telemetry)
+
     def read_battery_voltage(self):
         if self.bus is None or self.battery_register is None:
             return None
@@ -318,12 +450,10 @@ class HardwareManager:
             return {}
 
         status = {"voltage": voltage}
-        percent = None
-        if self.battery_full > self.battery_empty:
-            span = self.battery_full - self.battery_empty
-            percent = (voltage - self.battery_empty) / span * 100.0
-            percent = max(0.0, min(100.0, percent))
-            status["percent"] = percent
+        percent_per_volt = self._battery_percent_per_volt
+        if percent_per_volt is not None:
+            percent = (voltage - self.battery_empty) * percent_per_volt
+            status["percent"] = max(0.0, min(100.0, percent))
 
         if self.battery_cells:
             cell_voltage = voltage / self.battery_cells
@@ -365,63 +495,69 @@ class HardwareManager:
                         needed,
                     )
                     return None
-                fmt = "<" + "i" * self.encoder_total_count
-                counts = struct.unpack(fmt, bytes(data[:needed]))
-                left_values = [
-                    counts[i]
-                    for i in self.encoder_left_indices
-                    if 0 <= i < len(counts)
-                ]
-                right_values = [
-                    counts[i]
-                    for i in self.encoder_right_indices
-                    if 0 <= i < len(counts)
-                ]
-                left = (
-                    int(round(sum(left_values) / len(left_values)))
-                    if left_values
-                    else 0
-                )
-                right = (
-                    int(round(sum(right_values) / len(right_values)))
-                    if right_values
-                    else 0
-                )
+                counts = self._encoder_total_struct.unpack_from(bytes(data))
+                left = self._mean_count(counts, self._encoder_left_slots)
+                right = self._mean_count(counts, self._encoder_right_slots)
                 return {"left": left, "right": right}
 
             if self.left_encoder_register is None or self.right_encoder_register is None:
                 return None
 
+            if self._encoder_pair_register is not None:
+                data = self.bus.read_i2c_block_data(
+                    self.i2c_address, self._encoder_pair_register, 8
+                )
+                first, second = _INT32_PAIR.unpack(bytes(data))
+                if self._encoder_left_first:
+                    return {"left": first, "right": second}
+                return {"left": second, "right": first}
+
             left_bytes = self.bus.read_i2c_block_data(
                 self.i2c_address, self.left_encoder_register, 4
             )
             right_bytes = self.bus.read_i2c_block_data(
                 self.i2c_address, self.right_encoder_register, 4
             )
-            left = struct.unpack("<i", bytes(left_bytes))[0]
-            right = struct.unpack("<i", bytes(right_bytes))[0]
+            left = _INT32.unpack(bytes(left_bytes))[0]
+            right = _INT32.unpack(bytes(right_bytes))[0]
             return {"left": left, "right": right}
         except Exception:
             logger.exception("Failed reading encoder counts")
             return None
 
+    @staticmethod
+    def _mean_count(counts, slots):
+        if not slots:
+            return 0
+        return int(round(sum([counts[i] for i in slots]) / len(slots)))
+
     def update_odometry(self):
         if not self.odometry_enabled:
             return self._odometry_snapshot()
 
+        # The bus read happens outside the lock; only the state update is serialized.
+        # Readings are tagged with the sequence so one that straddles a reset is dropped.
+        sequence = self.odometry_sequence
         counts = self._read_encoder_counts()
         if counts is None:
             return self._odometry_snapshot()
 
+        with self._odometry_lock:
+            if sequence == self.odometry_sequence:
+                self._apply_encoder_counts(counts)
+        return self._odometry_snapshot()
+
+    def _apply_encoder_counts(self, counts):
+        """Integrate a new encoder reading into the pose and path (caller holds _odometry_lock)."""
         if self.last_encoder_counts is None:
             self.last_encoder_counts = counts
-            return self._odometry_snapshot()
+            return
 
         delta_left = counts["left"] - self.last_encoder_counts["left"]
         delta_right = counts["right"] - self.last_encoder_counts["right"]
 
         if delta_left == 0 and delta_right == 0:
-            return self._odometry_snapshot()
+            return
 
         self.last_encoder_counts = counts
 
@@ -430,69 +566,75 @@ class HardwareManager:
 
         distance_in = (left_distance_in + right_distance_in) / 2.0
         delta_theta = (right_distance_in - left_distance_in) / self.track_width_in
-        theta = self.odometry_pose["heading"]
-
-        if abs(delta_theta) < 1e-9:
-            dx = distance_in * math.cos(theta)
-            dy = distance_in * math.sin(theta)
-            segment_in = abs(distance_in)
-        else:
-            theta_new = theta + delta_theta
-            radius = distance_in / delta_theta
-            dx = radius * (math.sin(theta_new) - math.sin(theta))
-            dy = -radius * (math.cos(theta_new) - math.cos(theta))
-            segment_in = abs(delta_theta * radius)
-
-        self.odometry_pose["x"] += dx
-        self.odometry_pose["y"] += dy
-        self.odometry_pose["heading"] = ((theta + delta_theta + math.pi) % (2 * math.pi)) - math.pi
+        theta = self.pose_heading
+
+        # Move along the chord of the arc, at the mid-arc heading:
+        # R*(sin(t+d) - sin t) == 2R*sin(d/2)*cos(t + d/2), and likewise for y.
+        # With R = distance/d the chord is distance*sin(d/2)/(d/2), which tends to
+        # distance as d -> 0, so straight runs need no separate formula.
+        half_turn = delta_theta / 2.0
+        heading = theta + half_turn
+        chord = distance_in * math.sin(half_turn) / half_turn if abs(half_turn) > 1e-9 else distance_in
+        # The arc length is the mean wheel travel whatever the turn rate
+        segment_in = abs(distance_in)
+
+        x_in = self.pose_x_in = self.pose_x_in + chord * math.cos(heading)
+        y_in = self.pose_y_in = self.pose_y_in + chord * math.sin(heading)
+        self.pose_heading = ((theta + delta_theta + math.pi) % (2 * math.pi)) - math.pi
 
         self.total_distance_ft += segment_in / 12.0
 
-        self.path_points.append(
-            {
-                "x": self.odometry_pose["x"] / 12.0,
-                "y": self.odometry_pose["y"] / 12.0,
-            }
-        )
-
-        return self._odometry_snapshot()
+        self.path_points.append({"x": x_in / 12.0, "y": y_in / 12.0})
+        self._path_version += 1
 
     def _odometry_snapshot(self):
         return {
             "pose": {
-                "x": self.odometry_pose["x"] / 12.0,
-                "y": self.odometry_pose["y"] / 12.0,
-                "heading_rad": self.odometry_pose["heading"],
+                "x": self.pose_x_in / 12.0,
+                "y": self.pose_y_in / 12.0,
+                "heading_rad": self.pose_heading,
             },
             "total_distance_ft": self.total_distance_ft,
-            "path": list(self.path_points),
+            "path": self._path_snapshot(),
             "sequence": self.odometry_sequence,
             "return_available": self._has_unconsumed_manual_entries(),
             "return_in_progress": self._is_return_in_progress(),
         }
 
+    def _path_snapshot(self):
+        """The path as a list, rebuilt only after it changed (snapshots share it read-only)."""
+        version = self._path_version
+        cached = self._path_list
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        # Tagged with the version read first, so a change mid-copy forces a rebuild next time
+        path = list(self.path_points)
+        self._path_list = (version, path)
+        return path
+
     def reset_odometry(self):
         self._abort_return_to_start()
-        self.last_encoder_counts = None
-        self.odometry_pose = {"x": 0.0, "y": 0.0, "heading": 0.0}
-        self.total_distance_ft = 0.0
-        self.odometry_sequence += 1
-        self.path_points.clear()
-        self.path_points.append({"x": 0.0, "y": 0.0})
+        with self._odometry_lock:
+            # Zero the hardware counters first and bump the sequence last: any reading
+            # tagged with an older sequence may hold pre-reset totals and is dropped.
+            if self.bus is not None and self.encoder_reset_register is not None:
+                try:
+                    self.bus.write_byte_data(
+                        self.i2c_address,
+                        self.encoder_reset_register,
+                        self.encoder_reset_value & 0xFF,
+                    )
+                except Exception:
+                    logger.exception("Failed to reset encoder counters over I2C")
+            self.last_encoder_counts = None
+            self.pose_x_in = self.pose_y_in = self.pose_heading = 0.0
+            self.total_distance_ft = 0.0
+            self.odometry_sequence += 1
+            self.path_points.clear()
+            self.path_points.append({"x": 0.0, "y": 0.0})
+            self._path_version += 1
         self.reset_motion_log()
-
-        if self.bus is None or self.encoder_reset_register is None:
-            return
-
-        try:
-            self.bus.write_byte_data(
-                self.i2c_address,
-                self.encoder_reset_register,
-                self.encoder_reset_value & 0xFF,
-            )
-        except Exception:
-            logger.exception("Failed to reset encoder counters over I2C")
+        self._republish_telemetry()
 
     def reset_motion_log(self):
         with self._log_lock:
@@ -562,6 +704,8 @@ class HardwareManager:
                     self.returning_to_start = False
                     self._return_abort = None
 
+                self._republish_telemetry()
+
                 if on_complete:
                     try:
                         on_complete(result)
@@ -573,6 +717,7 @@ class HardwareManager:
             )
 
         threading.Thread(target=worker, daemon=True).start()
+        self._republish_telemetry()
         return True, "Returning to start"
 
     def _record_motion_command(self, left_speed, right_speed, *, source):
@@ -1,10 +1,21 @@
 # utils.py - Utility functions
 
+import json
 import logging
 import os
 import sys
 from datetime import datetime
 
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# numpy scalars/arrays (camera and odometry maths) serialize without conversion
+ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
 def setup_logging(log_level='INFO'):
     """Setup logging configuration"""
     os.makedirs('logs', exist_ok=True)
@@ -30,3 +41,51 @@ def get_timestamp():
 def clamp(value, min_val, max_val):
     """Clamp value between min and max"""
     return max(min_val, min(max_val, value))
+
+
+def prebuilt_json(obj):
+    """
+    Serialize a constant payload once. With orjson >= 3.9 the result is an orjson.Fragment,
+    which JsonCodec splices into each Socket.IO packet verbatim instead of re-encoding it;
+    otherwise (stdlib fallback) the object itself is returned and encoded per emit.
+    """
+    if orjson is not None and hasattr(orjson, "Fragment"):
+        return orjson.Fragment(orjson.dumps(obj, option=ORJSON_OPTIONS))
+    return obj
+
+
+class JsonCodec:
+    """json-module lookalike for Flask-SocketIO that uses orjson when installed."""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        if orjson is not None:
+            return orjson.dumps(obj, option=ORJSON_OPTIONS).decode("utf-8")
+        return json.dumps(obj, *args, **kwargs)
+
+    @staticmethod
+    def dumps_bytes(obj):
+        """Serialize straight to UTF-8 bytes (no intermediate str with orjson)."""
+        if orjson is not None:
+            return orjson.dumps(obj, option=ORJSON_OPTIONS)
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data, *args, **kwargs)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; defers to the default provider without it."""
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if orjson is None:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -98,6 +98,13 @@ def consolidate_files(root_dir='.', output_file='consolidated_project.txt'):
                 file_path = current_dir / file
                 relative_file_path = relative_dir / file
                 
+                # Never fold the output (or an earlier dump) back in; that is how
+                # modules such as backend/app.py ended up in the dump twice.
+                if file_path.resolve() == output_path or file.startswith('consolidated_project'):
+                    files_skipped += 1
+                    print(f"Skipped (previous output): {relative_file_path}")
+                    continue
+
                 # Skip certain files
                 if should_skip_file(file_path):
                     files_skipped += 1
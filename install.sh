@@ -39,7 +39,7 @@ print_status "Installing system dependencies..."
 sudo apt install -y \
     python3 python3-pip python3-venv python3-dev \
     git cmake build-essential pkg-config \
-    libhdf5-dev libjpeg-dev libopenjp2-7-dev \
+    libhdf5-dev libjpeg-dev libturbojpeg0 libopenjp2-7-dev \
     libssl-dev libffi-dev \
     libopenblas-dev || true  # Use openblas instead of atlas
 
@@ -74,6 +74,14 @@ else
     echo "i2c-dev" | sudo tee -a /etc/modules > /dev/null
 fi
 
+# Run the I2C bus at 400 kHz instead of the 100 kHz default (takes effect after reboot)
+BOOT_CONFIG=/boot/firmware/config.txt
+[ -f "$BOOT_CONFIG" ] || BOOT_CONFIG=/boot/config.txt
+if [ -f "$BOOT_CONFIG" ] && ! grep -q "^dtparam=i2c_arm_baudrate=" "$BOOT_CONFIG"; then
+    print_status "Setting I2C bus speed to 400 kHz in $BOOT_CONFIG..."
+    echo "dtparam=i2c_arm_baudrate=400000" | sudo tee -a "$BOOT_CONFIG" > /dev/null
+fi
+
 # Create project structure
 print_status "Creating project directories..."
 mkdir -p backend web/static/css web/static/js web/templates config logs media